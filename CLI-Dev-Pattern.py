@@ -14,7 +14,11 @@ Uso directo:
 import sys
 import os
 import argparse
+import functools
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
 # ─────────────────────────────────────────────
@@ -48,12 +52,27 @@ def _ansi_soportado() -> bool:
         # Windows 10 v1511+ soporta ANSI si se habilita vía kernel32
         try:
             import ctypes
-            kernel32 = ctypes.windll.kernel32
-            handle   = kernel32.GetStdHandle(-11)   # STD_OUTPUT_HANDLE
-            mode     = ctypes.c_ulong()
-            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            from ctypes import wintypes
+            # Instancia propia: las firmas fijadas aquí no alteran las de ctypes.windll,
+            # que comparte todo el proceso.
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+            # Firmas explícitas: evitan la inferencia de tipos de ctypes en cada llamada.
+            get_std_handle = kernel32.GetStdHandle
+            get_std_handle.argtypes = [wintypes.DWORD]
+            get_std_handle.restype  = wintypes.HANDLE
+            get_console_mode = kernel32.GetConsoleMode
+            get_console_mode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+            get_console_mode.restype  = wintypes.BOOL
+            set_console_mode = kernel32.SetConsoleMode
+            set_console_mode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+            set_console_mode.restype  = wintypes.BOOL
+
+            handle = get_std_handle(-11)   # STD_OUTPUT_HANDLE
+            mode   = wintypes.DWORD()
+            if get_console_mode(handle, ctypes.byref(mode)):
                 # Habilitar ENABLE_VIRTUAL_TERMINAL_PROCESSING (0x0004)
-                kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+                set_console_mode(handle, mode.value | 0x0004)
                 return True
         except Exception:
             pass
@@ -64,19 +83,57 @@ def _ansi_soportado() -> bool:
 _ANSI_OK = _ansi_soportado()
 
 
-def c(texto, color):
-    """Aplica color si la terminal lo soporta."""
-    if _ANSI_OK:
+# `c` se especializa una sola vez según la terminal detectada.
+if _ANSI_OK:
+    @functools.lru_cache(maxsize=512)
+    def c(texto, color):
+        """Aplica color ANSI. Memoizado: las etiquetas de UI se repiten."""
         return f"{COLORES.get(color, '')}{texto}{COLORES['reset']}"
-    return texto
+else:
+    def c(texto, color):
+        """La terminal no soporta ANSI: retorna el texto sin cambios."""
+        return texto
 
 
 # ─────────────────────────────────────────────
 #  TEMPLATES POR NIVEL
 # ─────────────────────────────────────────────
 
-def get_templates(nivel: int) -> dict:
-    """Retorna dict { ruta_relativa: contenido } para el nivel dado."""
+def get_templates(nivel: int) -> Mapping[str, str]:
+    """Retorna { ruta_relativa: contenido } para el nivel dado (solo lectura, precalculado)."""
+    return _TEMPLATES_POR_NIVEL.get(nivel, _SIN_TEMPLATES)
+
+
+def get_templates_bytes(nivel: int) -> Mapping[str, bytes]:
+    """Igual que get_templates, con los contenidos ya codificados en UTF-8."""
+    return _TEMPLATES_BYTES_POR_NIVEL.get(nivel, _SIN_TEMPLATES)
+
+
+@dataclass(frozen=True)
+class TemplateManifest:
+    """Rutas de un nivel; cada contenido se obtiene bajo demanda, de a uno."""
+    nivel: int
+    paths: Tuple[str, ...]
+
+    def get_body(self, path: str) -> str:
+        return get_templates(self.nivel)[path]
+
+    def get_bytes(self, path: str) -> bytes:
+        return get_templates_bytes(self.nivel)[path]
+
+
+def get_manifest(nivel: int) -> TemplateManifest:
+    """Retorna el manifiesto (rutas precalculadas) del nivel dado."""
+    return _MANIFIESTOS_POR_NIVEL.get(nivel) or TemplateManifest(nivel, ())
+
+
+def get_parent_dirs(nivel: int) -> Tuple[str, ...]:
+    """Directorios únicos a crear para el nivel, de menor a mayor profundidad."""
+    return _DIRECTORIOS_POR_NIVEL.get(nivel, ())
+
+
+def _construir_templates(nivel: int) -> dict:
+    """Construye dict { ruta_relativa: contenido } para el nivel dado."""
 
     templates = {}
 
@@ -90,11 +147,12 @@ Nivel 1 — Standalone Script (AETHERYON Dev Pattern)
 """
 
 import sys
-import argparse
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional
-from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import argparse
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -102,17 +160,18 @@ logger = logging.getLogger(__name__)
 
 # ==================== DOMAIN ====================
 
-class EstadoEntidad(Enum):
-    ACTIVO   = "activo"
-    INACTIVO = "inactivo"
+class EstadoEntidad:
+    # Constantes str internadas: comparar es una igualdad de punteros, sin Enum.__eq__.
+    ACTIVO   = sys.intern("activo")
+    INACTIVO = sys.intern("inactivo")
 
 
-@dataclass
+@dataclass(slots=True)
 class Entidad:
     """Entidad principal del dominio. Contiene reglas de negocio."""
     id:     Optional[int]
     nombre: str
-    estado: EstadoEntidad = EstadoEntidad.ACTIVO
+    estado: str = EstadoEntidad.ACTIVO
 
     def desactivar(self) -> None:
         """Regla de negocio: desactivar entidad."""
@@ -129,31 +188,35 @@ class Servicio:
     """Orquesta los casos de uso. Sin lógica de presentación."""
 
     def __init__(self):
-        self._entidades: List[Entidad] = []
+        # Índices por ID: búsqueda y borrado en O(1), listado de activas sin recorrer todo.
+        self._entidades: Dict[int, Entidad] = {}
+        self._activos:   Dict[int, Entidad] = {}
         self._next_id = 1
 
     def crear(self, nombre: str) -> Entidad:
         if not nombre or len(nombre.strip()) < 2:
             raise ValueError("El nombre debe tener al menos 2 caracteres.")
         entidad = Entidad(id=self._next_id, nombre=nombre.strip())
-        self._entidades.append(entidad)
+        self._entidades[entidad.id] = entidad
+        self._activos[entidad.id] = entidad
         self._next_id += 1
-        logger.info(f"Entidad creada: {entidad.nombre} (ID: {entidad.id})")
+        logger.info("Entidad creada: %s (ID: %s)", entidad.nombre, entidad.id)
         return entidad
 
     def listar(self, solo_activos: bool = False) -> List[Entidad]:
         if solo_activos:
-            return [e for e in self._entidades if e.estado == EstadoEntidad.ACTIVO]
-        return self._entidades.copy()
+            return list(self._activos.values())
+        return list(self._entidades.values())
 
     def obtener(self, entidad_id: int) -> Optional[Entidad]:
-        return next((e for e in self._entidades if e.id == entidad_id), None)
+        return self._entidades.get(entidad_id)
 
     def eliminar(self, entidad_id: int) -> bool:
-        entidad = self.obtener(entidad_id)
+        entidad = self._entidades.get(entidad_id)
         if entidad:
             entidad.desactivar()
-            logger.info(f"Entidad desactivada: ID {entidad_id}")
+            self._activos.pop(entidad_id, None)
+            logger.info("Entidad desactivada: ID %s", entidad_id)
             return True
         return False
 
@@ -165,19 +228,18 @@ class CLI:
 
     def __init__(self, servicio: Servicio):
         self.servicio = servicio
-
-    def ejecutar(self, args: argparse.Namespace) -> None:
-        acciones = {
+        self._acciones = {
             "crear":   self._crear,
             "listar":  self._listar,
             "obtener": self._obtener,
             "eliminar": self._eliminar,
         }
-        accion = acciones.get(args.comando)
-        if accion:
-            accion(args)
-        else:
-            print("Comando no reconocido.")
+
+    def ejecutar(self, args: "argparse.Namespace") -> None:
+        self._acciones.get(args.comando, self._no_reconocido)(args)
+
+    def _no_reconocido(self, args):
+        print("Comando no reconocido.")
 
     def _crear(self, args):
         try:
@@ -194,14 +256,14 @@ class CLI:
         print(f"\\n{'ID':<5} {'NOMBRE':<25} {'ESTADO':<10}")
         print("-" * 42)
         for e in entidades:
-            print(f"{e.id:<5} {e.nombre:<25} {e.estado.value:<10}")
+            print(f"{e.id:<5} {e.nombre:<25} {e.estado:<10}")
 
     def _obtener(self, args):
         e = self.servicio.obtener(args.id)
         if e:
             print(f"\\nID:     {e.id}")
             print(f"Nombre: {e.nombre}")
-            print(f"Estado: {e.estado.value}")
+            print(f"Estado: {e.estado}")
         else:
             print(f"❌ Entidad {args.id} no encontrada.")
 
@@ -217,6 +279,12 @@ class UI:
 
     def __init__(self, servicio: Servicio):
         self.servicio = servicio
+        self._opciones = {
+            "1": self._crear,
+            "2": self._mostrar_lista,
+            "3": self._buscar,
+            "4": self._eliminar,
+        }
 
     def ejecutar(self) -> None:
         print("\\n" + "=" * 40)
@@ -225,22 +293,20 @@ class UI:
         while True:
             print("\\n1. Crear  2. Listar  3. Buscar  4. Eliminar  5. Salir")
             opcion = input("Opción: ").strip()
-            if opcion == "1":
-                nombre = input("Nombre: ").strip()
-                try:
-                    e = self.servicio.crear(nombre)
-                    print(f"✅ Creado ID: {e.id}")
-                except ValueError as ex:
-                    print(f"❌ {ex}")
-            elif opcion == "2":
-                self._mostrar_lista()
-            elif opcion == "3":
-                self._buscar()
-            elif opcion == "4":
-                self._eliminar()
-            elif opcion == "5":
+            if opcion == "5":
                 print("Hasta luego.")
                 break
+            accion = self._opciones.get(opcion)
+            if accion:
+                accion()
+
+    def _crear(self):
+        nombre = input("Nombre: ").strip()
+        try:
+            e = self.servicio.crear(nombre)
+            print(f"✅ Creado ID: {e.id}")
+        except ValueError as ex:
+            print(f"❌ {ex}")
 
     def _mostrar_lista(self):
         entidades = self.servicio.listar()
@@ -248,13 +314,13 @@ class UI:
             print("Lista vacía.")
             return
         for e in entidades:
-            print(f"  [{e.id}] {e.nombre} — {e.estado.value}")
+            print(f"  [{e.id}] {e.nombre} — {e.estado}")
 
     def _buscar(self):
         try:
             eid = int(input("ID: ").strip())
             e = self.servicio.obtener(eid)
-            print(f"{e.nombre} ({e.estado.value})" if e else "No encontrada.")
+            print(f"{e.nombre} ({e.estado})" if e else "No encontrada.")
         except ValueError:
             print("ID inválido.")
 
@@ -269,6 +335,12 @@ class UI:
 # ==================== MAIN ====================
 
 def main():
+    # Sin argumentos: modo UI directo, sin importar ni construir argparse.
+    if len(sys.argv) == 1:
+        UI(Servicio()).ejecutar()
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(description="Proyecto — Nivel 1 AETHERYON")
     parser.add_argument("--modo", choices=["cli", "ui"], default="ui")
 
@@ -311,63 +383,102 @@ Nivel 2 — Patrón BF (AETHERYON Dev Pattern)
 Regla: el frontend importa al backend. Nunca al revés.
 """
 
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 
-@dataclass
+# Último segundo formateado: en altas masivas casi todas las entidades lo comparten.
+_ISO_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _iso(ns: int) -> str:
+    """Formatea un timestamp en nanosegundos como ISO 8601 (precisión de segundos)."""
+    global _ISO_CACHE
+    segundo = ns // 1_000_000_000
+    if _ISO_CACHE[0] != segundo:
+        _ISO_CACHE = (segundo, datetime.fromtimestamp(segundo).isoformat())
+    return _ISO_CACHE[1]
+
+
+@dataclass(slots=True)
 class Entidad:
     """Entidad principal del dominio."""
     id:             Optional[int]
     nombre:         str
     descripcion:    str = ""
     activo:         bool = True
-    fecha_creacion: str = field(default_factory=lambda: datetime.now().isoformat())
+    fecha_creacion: int = field(default_factory=time.time_ns)
 
     def desactivar(self) -> None:
         self.activo = False
 
+    @property
+    def fecha_creacion_iso(self) -> str:
+        return _iso(self.fecha_creacion)
+
 
 class GestorEntidades:
     """Lógica de negocio pura, sin presentación."""
 
     def __init__(self):
-        self._entidades: List[Entidad] = []
+        # Índices por ID: búsqueda y borrado en O(1), listado de activas sin recorrer todo.
+        self._entidades: Dict[int, Entidad] = {}
+        self._activos:   Dict[int, Entidad] = {}
+        # Índice de búsqueda: texto en minúsculas por ID y trigramas -> IDs.
+        self._texto_lower: Dict[int, str]      = {}
+        self._trigramas:   Dict[str, Set[int]] = defaultdict(set)
         self._next_id = 1
 
     def agregar(self, nombre: str, descripcion: str = "") -> Entidad:
         if not nombre or len(nombre.strip()) < 2:
             raise ValueError("Nombre debe tener al menos 2 caracteres.")
         e = Entidad(id=self._next_id, nombre=nombre.strip(), descripcion=descripcion)
-        self._entidades.append(e)
+        self._entidades[e.id] = e
+        self._activos[e.id] = e
+        self._indexar(e)
         self._next_id += 1
         return e
 
     def obtener_todas(self) -> List[Entidad]:
-        return self._entidades.copy()
+        return list(self._entidades.values())
 
     def obtener_activas(self) -> List[Entidad]:
-        return [e for e in self._entidades if e.activo]
+        return list(self._activos.values())
 
     def obtener_por_id(self, entidad_id: int) -> Optional[Entidad]:
-        return next((e for e in self._entidades if e.id == entidad_id), None)
+        return self._entidades.get(entidad_id)
 
     def eliminar(self, entidad_id: int) -> bool:
-        e = self.obtener_por_id(entidad_id)
+        e = self._entidades.get(entidad_id)
         if e:
             e.desactivar()
+            self._activos.pop(entidad_id, None)
             return True
         return False
 
     def buscar(self, texto: str) -> List[Entidad]:
         t = texto.lower()
-        return [e for e in self._entidades
-                if t in e.nombre.lower() or t in e.descripcion.lower()]
+        if len(t) < 3:
+            return [self._entidades[i] for i, txt in self._texto_lower.items() if t in txt]
+        # Intersección de postings, de la lista más corta a la más larga.
+        postings = sorted((self._trigramas.get(t[i:i + 3], set()) for i in range(len(t) - 2)),
+                          key=len)
+        candidatos = set.intersection(*postings)
+        return [self._entidades[i] for i in sorted(candidatos) if t in self._texto_lower[i]]
+
+    def _indexar(self, e: Entidad) -> None:
+        # "\\0" separa nombre y descripción para que ninguna coincidencia cruce ambos campos.
+        texto = f"{e.nombre.lower()}\\0{e.descripcion.lower()}"
+        self._texto_lower[e.id] = texto
+        for i in range(len(texto) - 2):
+            self._trigramas[texto[i:i + 3]].add(e.id)
 
     def estadisticas(self) -> Dict[str, Any]:
         total    = len(self._entidades)
-        activas  = len([e for e in self._entidades if e.activo])
+        activas  = len(self._activos)
         return {"total": total, "activas": activas, "inactivas": total - activas}
 
 
@@ -414,6 +525,8 @@ class Aplicacion:
 
     def __init__(self):
         self.backend = Backend()
+        self._filas = {}  # id -> valores actualmente mostrados en la tabla
+        self._busqueda_pendiente = None  # id de root.after() del debounce de búsqueda
         self._crear_ventana()
         self._crear_widgets()
         self._cargar_datos()
@@ -439,7 +552,7 @@ class Aplicacion:
         ttk.Label(toolbar, text="Buscar:").pack(side=tk.LEFT)
         self.entry_buscar = ttk.Entry(toolbar, width=20)
         self.entry_buscar.pack(side=tk.LEFT, padx=5)
-        self.entry_buscar.bind("<KeyRelease>", self._buscar)
+        self.entry_buscar.bind("<KeyRelease>", self._on_tecla_buscar)
 
         # ── Tabla ──
         frame_tabla = ttk.Frame(self.root)
@@ -469,14 +582,21 @@ class Aplicacion:
         self.lbl_stats.pack(side=tk.RIGHT, padx=10)
 
     def _cargar_datos(self, entidades=None):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         datos = entidades if entidades is not None else self.backend.obtener_entidades()
-        for e in datos:
-            self.tree.insert("", "end",
-                values=(e.id, e.nombre, e.descripcion,
-                        "✅" if e.activo else "❌", e.fecha_creacion[:10]),
-                iid=str(e.id))
+        # Actualización diferencial: solo se tocan las filas que cambian.
+        nuevas = {e.id: (e.id, e.nombre, e.descripcion,
+                         "✅" if e.activo else "❌", e.fecha_creacion_iso[:10])
+                  for e in datos}
+        obsoletas = [str(eid) for eid in self._filas if eid not in nuevas]
+        if obsoletas:
+            self.tree.delete(*obsoletas)
+        for indice, (eid, valores) in enumerate(nuevas.items()):
+            anteriores = self._filas.get(eid)
+            if anteriores is None:
+                self.tree.insert("", indice, values=valores, iid=str(eid))
+            elif anteriores != valores:
+                self.tree.item(str(eid), values=valores)
+        self._filas = nuevas
         stats = self.backend.obtener_estadisticas()
         self.lbl_stats.config(text=f"Total: {stats['total']} | Activas: {stats['activas']}")
 
@@ -502,7 +622,14 @@ class Aplicacion:
             self.backend.eliminar_entidad(eid)
             self._cargar_datos()
 
+    def _on_tecla_buscar(self, _event=None):
+        # Debounce: una ráfaga de teclas dispara una sola búsqueda, 150 ms después de la última.
+        if self._busqueda_pendiente is not None:
+            self.root.after_cancel(self._busqueda_pendiente)
+        self._busqueda_pendiente = self.root.after(150, self._buscar)
+
     def _buscar(self, _event=None):
+        self._busqueda_pendiente = None
         texto = self.entry_buscar.get().strip()
         if texto:
             resultados = self.backend.buscar_entidades(texto)
@@ -555,6 +682,7 @@ if __name__ == "__main__":
         templates["Infrastructure/persistencia/__init__.py"] = ""
         templates["Infrastructure/persistencia/base_datos/__init__.py"] = ""
         templates["Infrastructure/persistencia/base_datos/conexion.py"] = _tpl_conexion()
+        templates["Infrastructure/persistencia/base_datos/pool.py"] = _tpl_pool()
         templates["Infrastructure/persistencia/repositorios/__init__.py"] = ""
         templates["Infrastructure/persistencia/repositorios/repositorio_entidad_sql.py"] = _tpl_repositorio_sql()
         templates["Infrastructure/servicios_externos/__init__.py"] = ""
@@ -632,7 +760,7 @@ class EstadoEntidad:
     INACTIVO = "inactivo"
 
 
-@dataclass
+@dataclass(slots=True)
 class Entidad:
     """
     Entidad principal. Raíz del agregado.
@@ -692,15 +820,24 @@ from dataclasses import dataclass
 from Domain.excepciones.excepciones_dominio import NombreInvalido
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nombre:
-    """Nombre validado. Inmutable."""
+    """Nombre validado. Inmutable. Construir con Nombre.crear(texto)."""
     valor: str
 
-    def __post_init__(self):
-        if not self.valor or len(self.valor.strip()) < 2:
+    @classmethod
+    def crear(cls, valor: str) -> "Nombre":
+        """Normaliza y valida antes de construir: una sola escritura del campo."""
+        limpio = valor.strip() if valor else ""
+        if len(limpio) < 2:
             raise NombreInvalido("El nombre debe tener al menos 2 caracteres.")
-        object.__setattr__(self, "valor", self.valor.strip())
+        return cls(limpio)
+
+    def __post_init__(self):
+        # Chequeo O(1) del invariante (ya normalizado); no reescribe el campo.
+        v = self.valor
+        if not v or len(v) < 2 or v[0].isspace() or v[-1].isspace():
+            raise NombreInvalido("Nombre no normalizado: usa Nombre.crear().")
 
     def __str__(self) -> str:
         return self.valor
@@ -785,8 +922,11 @@ Domain nunca depende de este archivo.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 from Domain.entidades.entidad import Entidad
+from Application.dto.entidad_dto import EntidadDTO
+
+COLUMNAS = ("id", "nombre", "descripcion", "estado", "fecha_creacion")
 
 
 class RepositorioEntidad(ABC):
@@ -800,13 +940,37 @@ class RepositorioEntidad(ABC):
         pass
 
     @abstractmethod
-    def listar(self, solo_activos: bool = False) -> List[Entidad]:
+    def listar(self, solo_activos: bool = False,
+               limit: Optional[int] = None, offset: int = 0) -> List[Entidad]:
+        """limit=None devuelve todas las filas a partir de offset (orden por id)."""
         pass
 
+    def iterar(self, solo_activos: bool = False) -> Iterator[Entidad]:
+        """Recorre las entidades sin materializar la lista (si la implementación lo permite)."""
+        return iter(self.listar(solo_activos))
+
+    def listar_dtos(self, solo_activos: bool = False,
+                    limit: Optional[int] = None, offset: int = 0) -> List[EntidadDTO]:
+        """Lectura directa a DTO. Las implementaciones pueden omitir la Entidad intermedia."""
+        return [EntidadDTO.desde_entidad(e) for e in self.listar(solo_activos, limit, offset)]
+
+    def iterar_dtos(self, solo_activos: bool = False) -> Iterator[EntidadDTO]:
+        return map(EntidadDTO.desde_entidad, self.iterar(solo_activos))
+
+    def listar_columnar(self, solo_activos: bool = False,
+                        limit: Optional[int] = None, offset: int = 0) -> Dict[str, Sequence]:
+        """Una secuencia por campo (claves de COLUMNAS), todas en el mismo orden de filas."""
+        entidades = self.listar(solo_activos, limit, offset)
+        return {col: [getattr(e, col) for e in entidades] for col in COLUMNAS}
+
     @abstractmethod
     def guardar(self, entidad: Entidad) -> Entidad:
         pass
 
+    def guardar_muchos(self, entidades: List[Entidad]) -> List[Entidad]:
+        """Alta masiva. Las implementaciones pueden sobreescribirlo con una sola transacción."""
+        return [self.guardar(e) for e in entidades]
+
     @abstractmethod
     def actualizar(self, entidad: Entidad) -> bool:
         pass
@@ -832,7 +996,7 @@ from typing import Optional
 from Domain.entidades.entidad import Entidad
 
 
-@dataclass
+@dataclass(slots=True)
 class EntidadDTO:
     """Solo estructura. Sin lógica de negocio."""
     id:          Optional[int]
@@ -843,13 +1007,8 @@ class EntidadDTO:
 
     @classmethod
     def desde_entidad(cls, e: Entidad) -> "EntidadDTO":
-        return cls(
-            id=e.id,
-            nombre=e.nombre,
-            descripcion=e.descripcion,
-            estado=e.estado,
-            esta_activo=e.esta_activo,
-        )
+        # Posicional (mismo orden que los campos): se llama en cada lectura.
+        return cls(e.id, e.nombre, e.descripcion, e.estado, e.esta_activo)
 
     def to_dict(self) -> dict:
         return {
@@ -861,7 +1020,7 @@ class EntidadDTO:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SolicitudCrearEntidadDTO:
     nombre:      str
     descripcion: str = ""
@@ -885,29 +1044,42 @@ Regla: coordina, no implementa. Depende de interfaces, no de implementaciones.
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from Domain.entidades.entidad import Entidad
 from Domain.excepciones.excepciones_dominio import EntidadNoEncontrada
 from Application.interfaces.repositorio_entidad import RepositorioEntidad
 from Application.dto.entidad_dto import EntidadDTO, SolicitudCrearEntidadDTO
 
+# Un logger por módulo; los mensajes usan %s para que el formateo solo ocurra
+# si el nivel está activo (no en cada alta).
+logger = logging.getLogger(__name__)
+
 
 class ServicioEntidad:
     """Orquesta los casos de uso de Entidad."""
 
     def __init__(self, repositorio: RepositorioEntidad):
         self.repositorio = repositorio
-        self.logger = logging.getLogger(__name__)
 
     def crear(self, solicitud: SolicitudCrearEntidadDTO) -> EntidadDTO:
         """Caso de uso: crear una nueva entidad."""
-        self.logger.info(f"Creando entidad: {solicitud.nombre}")
+        logger.info("Creando entidad: %s", solicitud.nombre)
         entidad = Entidad(id=None, nombre=solicitud.nombre, descripcion=solicitud.descripcion)
         guardada = self.repositorio.guardar(entidad)
-        self.logger.info(f"Entidad creada con ID: {guardada.id}")
+        logger.info("Entidad creada con ID: %s", guardada.id)
         return EntidadDTO.desde_entidad(guardada)
 
+    def crear_muchos(self, solicitudes: List[SolicitudCrearEntidadDTO]) -> List[EntidadDTO]:
+        """Caso de uso: alta masiva (importaciones, datos de prueba)."""
+        entidades = [
+            Entidad(id=None, nombre=s.nombre, descripcion=s.descripcion)
+            for s in solicitudes
+        ]
+        guardadas = self.repositorio.guardar_muchos(entidades)
+        logger.info("%d entidades creadas", len(guardadas))
+        return [EntidadDTO.desde_entidad(e) for e in guardadas]
+
     def obtener(self, entidad_id: int) -> EntidadDTO:
         """Caso de uso: obtener entidad por ID."""
         entidad = self.repositorio.obtener_por_id(entidad_id)
@@ -915,10 +1087,20 @@ class ServicioEntidad:
             raise EntidadNoEncontrada(entidad_id)
         return EntidadDTO.desde_entidad(entidad)
 
-    def listar(self, solo_activos: bool = False) -> List[EntidadDTO]:
-        """Caso de uso: listar todas las entidades."""
-        entidades = self.repositorio.listar(solo_activos)
-        return [EntidadDTO.desde_entidad(e) for e in entidades]
+    def listar(self, solo_activos: bool = False,
+               limit: Optional[int] = None, offset: int = 0) -> List[EntidadDTO]:
+        """Caso de uso: listar entidades (todas, o una página con limit/offset)."""
+        # Solo lectura: no hacen falta invariantes de dominio, se leen DTOs directamente.
+        return self.repositorio.listar_dtos(solo_activos, limit, offset)
+
+    def iterar(self, solo_activos: bool = False) -> Iterator[EntidadDTO]:
+        """Caso de uso: recorrer entidades en streaming (sin lista intermedia)."""
+        return self.repositorio.iterar_dtos(solo_activos)
+
+    def listar_columnar(self, solo_activos: bool = False,
+                        limit: Optional[int] = None, offset: int = 0) -> Dict[str, Sequence]:
+        """Caso de uso: listado para tablas (columnas paralelas, sin objeto por fila)."""
+        return self.repositorio.listar_columnar(solo_activos, limit, offset)
 
     def eliminar(self, entidad_id: int) -> bool:
         """Caso de uso: eliminar entidad (borrado lógico)."""
@@ -941,88 +1123,218 @@ Regla: implementa el contrato de Application. Domain nunca importa este archivo.
 
 import sqlite3
 import logging
-from typing import List, Optional
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 from datetime import datetime
 
 from Domain.entidades.entidad import Entidad, EstadoEntidad
-from Application.interfaces.repositorio_entidad import RepositorioEntidad
+from Application.dto.entidad_dto import EntidadDTO
+from Application.interfaces.repositorio_entidad import COLUMNAS, RepositorioEntidad
+from Infrastructure.persistencia.base_datos.pool import ConnectionPool
+
+# estado se guarda como INTEGER 1/0: comparación entera en SQLite y celda de 1 byte.
+# Las capas superiores siguen viendo las etiquetas de EstadoEntidad.
+_ESTADO_A_INT = {EstadoEntidad.ACTIVO: 1, EstadoEntidad.INACTIVO: 0}
+_INT_A_ESTADO = (EstadoEntidad.INACTIVO, EstadoEntidad.ACTIVO)
+
+# Métodos sin enlazar resueltos una vez: en los bucles por fila no se busca el atributo.
+_a_epoch     = datetime.timestamp
+_desde_epoch = datetime.fromtimestamp
+_ahora       = datetime.now
+
+logger = logging.getLogger(__name__)
 
 
 class RepositorioEntidadSQL(RepositorioEntidad):
     """Implementación SQLite. Puede reemplazarse por PostgreSQL, MongoDB, etc."""
 
-    def __init__(self, conexion: sqlite3.Connection):
-        self.conn = conexion
-        self.logger = logging.getLogger(__name__)
+    # SQL fijo por operación: el mismo texto en cada llamada reutiliza la sentencia
+    # preparada de la caché de sqlite3 (sin re-parsear ni re-planificar).
+    _SQL_GET         = "SELECT id, nombre, descripcion, estado, fecha_creacion FROM entidades WHERE id = ?"
+    _SQL_LIST        = "SELECT id, nombre, descripcion, estado, fecha_creacion FROM entidades"
+    _SQL_LIST_ACTIVE = _SQL_LIST + " WHERE estado = 1"
+    _SQL_PAGINA      = " ORDER BY id LIMIT ? OFFSET ?"  # LIMIT -1 = sin límite
+    _SQL_INSERT      = ("INSERT INTO entidades (nombre, descripcion, estado, fecha_creacion) "
+                        "VALUES (?, ?, ?, ?)")
+    _SQL_INSERT_ID   = _SQL_INSERT + " RETURNING id"
+    _SQL_UPDATE      = "UPDATE entidades SET nombre = ?, descripcion = ?, estado = ? WHERE id = ?"
+    _SQL_SOFT_DELETE = "UPDATE entidades SET estado = 0 WHERE id = ?"
+
+    _TAM_LOTE = 200  # filas por fetchmany()
+
+    # Columnas cuyo tipo cambió en una migración: columna -> (tipo esperado, migración).
+    # CREATE TABLE IF NOT EXISTS no toca una tabla existente, así que se verifica al abrir.
+    _TIPOS_ESPERADOS = {
+        "fecha_creacion": ("INTEGER", "003_fecha_creacion_epoch"),
+        "estado":         ("INTEGER", "004_estado_int"),
+    }
+    _RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)  # INSERT ... RETURNING
+
+    def __init__(self, conexion: Union[sqlite3.Connection, ConnectionPool]):
+        # Acepta un pool (Backend) o una conexión suelta (tests), que se envuelve en uno.
+        self.pool = conexion if isinstance(conexion, ConnectionPool) else ConnectionPool.de_conexion(conexion)
         self._crear_tabla()
 
     def _crear_tabla(self):
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS entidades (
-                id             INTEGER PRIMARY KEY AUTOINCREMENT,
-                nombre         TEXT    NOT NULL,
-                descripcion    TEXT    DEFAULT "",
-                estado         TEXT    DEFAULT "activo",
-                fecha_creacion TEXT
+        with self.pool.acquire() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entidades (
+                    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nombre         TEXT    NOT NULL,
+                    descripcion    TEXT    DEFAULT "",
+                    estado         INTEGER DEFAULT 1,
+                    fecha_creacion INTEGER
+                )
+            """)
+            # listar(solo_activos=True) filtra por estado; el índice evita el full scan.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entidades_estado ON entidades(estado)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entidades_nombre ON entidades(nombre COLLATE NOCASE)"
             )
-        """)
-        self.conn.commit()
+            conn.commit()
+            self._verificar_esquema(conn)
+
+    def _verificar_esquema(self, conn):
+        """Falla con un mensaje claro si la BD existente no tiene aplicadas las migraciones."""
+        tipos = {fila[1]: fila[2].upper() for fila in conn.execute("PRAGMA table_info(entidades)")}
+        for columna, (tipo, migracion) in self._TIPOS_ESPERADOS.items():
+            if tipos.get(columna, tipo) != tipo:
+                raise RuntimeError(
+                    f"La tabla 'entidades' tiene un esquema antiguo ({columna} {tipos[columna]}, "
+                    f"se esperaba {tipo}). Ejecuta 'python Scripts/migraciones.py init' "
+                    f"(migración {migracion})."
+                )
 
     def obtener_por_id(self, entidad_id: int) -> Optional[Entidad]:
-        cursor = self.conn.execute(
-            "SELECT id, nombre, descripcion, estado, fecha_creacion FROM entidades WHERE id = ?",
-            (entidad_id,)
-        )
-        fila = cursor.fetchone()
-        return self._fila_a_entidad(fila) if fila else None
+        with self.pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = self._fila_a_entidad
+            return cursor.execute(self._SQL_GET, (entidad_id,)).fetchone()
+
+    def listar(self, solo_activos: bool = False,
+               limit: Optional[int] = None, offset: int = 0) -> List[Entidad]:
+        return self._listar_filas(solo_activos, self._fila_a_entidad, limit, offset)
+
+    def iterar(self, solo_activos: bool = False) -> Iterator[Entidad]:
+        return self._iterar_filas(solo_activos, self._fila_a_entidad)
+
+    def listar_dtos(self, solo_activos: bool = False,
+                    limit: Optional[int] = None, offset: int = 0) -> List[EntidadDTO]:
+        return self._listar_filas(solo_activos, self._fila_a_dto, limit, offset)
+
+    def iterar_dtos(self, solo_activos: bool = False) -> Iterator[EntidadDTO]:
+        return self._iterar_filas(solo_activos, self._fila_a_dto)
+
+    def listar_columnar(self, solo_activos: bool = False,
+                        limit: Optional[int] = None, offset: int = 0) -> Dict[str, Sequence]:
+        """
+        Columnas paralelas en lugar de un objeto por fila.
+        id y fecha_creacion van en array('q') (enteros de 8 bytes contiguos, sin boxing).
+        """
+        with self.pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # tuplas simples: solo se transponen
+            filas = cursor.execute(*self._consulta(solo_activos, limit, offset)).fetchall()
+        if not filas:
+            return {col: () for col in COLUMNAS}
+        ids, nombres, descripciones, estados, fechas = zip(*filas)
+        return {
+            "id":             array("q", ids),
+            "nombre":         nombres,
+            "descripcion":    tuple(d or "" for d in descripciones),
+            "estado":         tuple(map(_INT_A_ESTADO.__getitem__, estados)),
+            "fecha_creacion": array("q", (f or 0 for f in fechas)),
+        }
 
-    def listar(self, solo_activos: bool = False) -> List[Entidad]:
-        if solo_activos:
-            cursor = self.conn.execute(
-                "SELECT id, nombre, descripcion, estado, fecha_creacion FROM entidades WHERE estado = ?",
-                (EstadoEntidad.ACTIVO,)
-            )
-        else:
-            cursor = self.conn.execute(
-                "SELECT id, nombre, descripcion, estado, fecha_creacion FROM entidades"
-            )
-        return [self._fila_a_entidad(f) for f in cursor.fetchall()]
+    def _consulta(self, solo_activos: bool, limit: Optional[int], offset: int):
+        """SQL y parámetros del listado. Solo dos textos por filtro: la caché de sentencias los reutiliza."""
+        sql = self._SQL_LIST_ACTIVE if solo_activos else self._SQL_LIST
+        if limit is None and not offset:
+            return sql, ()
+        return sql + self._SQL_PAGINA, (-1 if limit is None else limit, offset)
+
+    # Las fábricas (_fila_a_entidad / _fila_a_dto) se instalan como row_factory del cursor:
+    # sqlite3 construye el objeto final al leer cada fila, sin sqlite3.Row intermedio.
+
+    def _listar_filas(self, solo_activos: bool, fabrica,
+                      limit: Optional[int] = None, offset: int = 0) -> list:
+        with self.pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = fabrica
+            return cursor.execute(*self._consulta(solo_activos, limit, offset)).fetchall()
+
+    def _iterar_filas(self, solo_activos: bool, fabrica) -> Iterator:
+        """Lee por lotes con fetchmany(): el consumidor procesa mientras se leen más filas."""
+        with self.pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = fabrica
+            cursor.arraysize = self._TAM_LOTE
+            cursor.execute(*self._consulta(solo_activos, None, 0))
+            while True:
+                filas = cursor.fetchmany()
+                if not filas:
+                    break
+                yield from filas
 
     def guardar(self, entidad: Entidad) -> Entidad:
-        cursor = self.conn.execute(
-            "INSERT INTO entidades (nombre, descripcion, estado, fecha_creacion) VALUES (?, ?, ?, ?)",
-            (entidad.nombre, entidad.descripcion, entidad.estado,
-             entidad.fecha_creacion.isoformat())
-        )
-        self.conn.commit()
-        entidad.id = cursor.lastrowid
+        parametros = (entidad.nombre, entidad.descripcion, _ESTADO_A_INT[entidad.estado],
+                      int(_a_epoch(entidad.fecha_creacion)))
+        with self.pool.acquire() as conn:
+            if self._RETURNING:
+                # El id llega con la propia sentencia, ligado a este INSERT.
+                entidad.id = conn.execute(self._SQL_INSERT_ID, parametros).fetchone()[0]
+            else:
+                entidad.id = conn.execute(self._SQL_INSERT, parametros).lastrowid
+            conn.commit()
         return entidad
 
+    def guardar_muchos(self, entidades: List[Entidad]) -> List[Entidad]:
+        """Inserta todas las entidades en una sola transacción (un solo commit/fsync)."""
+        if not entidades:
+            return []
+        parametros = [
+            (e.nombre, e.descripcion, _ESTADO_A_INT[e.estado], int(_a_epoch(e.fecha_creacion)))
+            for e in entidades
+        ]
+        with self.pool.acquire() as conn, conn:
+            conn.executemany(self._SQL_INSERT, parametros)
+            ultimo = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        # Dentro de una transacción los IDs AUTOINCREMENT asignados son consecutivos.
+        for nuevo_id, entidad in enumerate(entidades, start=ultimo - len(entidades) + 1):
+            entidad.id = nuevo_id
+        return entidades
+
     def actualizar(self, entidad: Entidad) -> bool:
-        cursor = self.conn.execute(
-            "UPDATE entidades SET nombre = ?, descripcion = ?, estado = ? WHERE id = ?",
-            (entidad.nombre, entidad.descripcion, entidad.estado, entidad.id)
-        )
-        self.conn.commit()
+        with self.pool.acquire() as conn:
+            cursor = conn.execute(
+                self._SQL_UPDATE,
+                (entidad.nombre, entidad.descripcion, _ESTADO_A_INT[entidad.estado], entidad.id)
+            )
+            conn.commit()
         return cursor.rowcount > 0
 
     def eliminar(self, entidad_id: int) -> bool:
-        cursor = self.conn.execute(
-            "UPDATE entidades SET estado = ? WHERE id = ?",
-            (EstadoEntidad.INACTIVO, entidad_id)
-        )
-        self.conn.commit()
+        with self.pool.acquire() as conn:
+            cursor = conn.execute(self._SQL_SOFT_DELETE, (entidad_id,))
+            conn.commit()
         return cursor.rowcount > 0
 
     @staticmethod
-    def _fila_a_entidad(fila) -> Entidad:
+    def _fila_a_entidad(_cursor, fila) -> Entidad:
+        # Firma de row_factory: fila es la tupla cruda de SQLite (acceso posicional).
+        # fecha_creacion es epoch (INTEGER): fromtimestamp evita parsear ISO por fila.
         return Entidad(
             id=fila[0],
             nombre=fila[1],
             descripcion=fila[2] or "",
-            estado=fila[3],
-            fecha_creacion=datetime.fromisoformat(fila[4]) if fila[4] else datetime.now(),
+            estado=_INT_A_ESTADO[fila[3]],
+            fecha_creacion=_desde_epoch(fila[4]) if fila[4] is not None else _ahora(),
         )
+
+    @staticmethod
+    def _fila_a_dto(_cursor, fila) -> EntidadDTO:
+        # Lecturas de la UI: fila -> DTO sin construir (ni validar) una Entidad intermedia.
+        return EntidadDTO(fila[0], fila[1], fila[2] or "", _INT_A_ESTADO[fila[3]], fila[3] == 1)
 '''
 
 
@@ -1039,25 +1351,153 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_MODOS_SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
 
-def obtener_conexion(db_path: Optional[str] = None) -> sqlite3.Connection:
+
+def obtener_conexion(db_path: Optional[str] = None,
+                     synchronous: str = "NORMAL",
+                     check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Crea y retorna una conexión SQLite.
-    Usa :memory: para tests.
+    Usa :memory: para tests. El pool pasa check_same_thread=False.
+
+    En disco activa WAL + synchronous=NORMAL: las escrituras se añaden al WAL
+    en lugar de forzar un fsync por commit. synchronous="OFF" solo para tests.
     """
     ruta = db_path or "data/app.db"
+    synchronous = synchronous.upper()
+    if synchronous not in _MODOS_SYNCHRONOUS:
+        raise ValueError(f"synchronous inválido: {synchronous}")
 
     if ruta != ":memory:":
         import os
         os.makedirs(os.path.dirname(ruta), exist_ok=True)
 
-    conn = sqlite3.connect(ruta)
+    # Caché de sentencias preparadas más amplia que la por defecto (128).
+    conn = sqlite3.connect(ruta, cached_statements=256, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
-    logger.info(f"Conexión establecida: {ruta}")
+    if ruta != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA mmap_size=268435456")   # 256 MB
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")         # ~20 MB
+    logger.info("Conexión establecida: %s", ruta)
     return conn
 '''
 
 
+def _tpl_pool():
+    return '''\
+"""
+Infrastructure/persistencia/base_datos/pool.py
+Pool de conexiones SQLite.
+
+Con WAL varios lectores avanzan en paralelo con un escritor; el pool reutiliza
+conexiones ya abiertas y configuradas en lugar de serializar todo por una sola.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+
+class _Prestamo:
+    """Conexión prestada a un hilo y cuántos `acquire` abiertos la usan."""
+
+    __slots__ = ("conexion", "usos")
+
+    def __init__(self):
+        self.conexion: Optional[sqlite3.Connection] = None
+        self.usos = 0
+
+
+class ConnectionPool:
+    """Pool LIFO de conexiones. Se abren bajo demanda, hasta `tamano`."""
+
+    def __init__(self, fabrica: Callable[[], sqlite3.Connection], tamano: int = 4):
+        if tamano < 1:
+            raise ValueError("El pool necesita al menos una conexión.")
+        self._fabrica = fabrica
+        self._tamano  = tamano
+        self._libres: queue.LifoQueue = queue.LifoQueue()
+        self._todas:  List[sqlite3.Connection] = []
+        self._lock    = threading.Lock()
+        self._local   = threading.local()
+        self._cerrado = False
+
+    @classmethod
+    def de_conexion(cls, conexion: sqlite3.Connection) -> "ConnectionPool":
+        """Pool de una sola conexión ya abierta (tests, :memory:)."""
+        return cls(lambda: conexion, tamano=1)
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """
+        Presta una conexión y la devuelve cuando la suelta el último uso del hilo.
+
+        Los usos anidados o intercalados de un mismo hilo (p. ej. dos iteradores
+        abiertos) comparten su conexión, así un pool de tamaño 1 no se bloquea a
+        sí mismo. El préstamo se cuenta por usos y se libera sobre el préstamo
+        capturado, aunque el generador que lo tiene se finalice en otro hilo.
+        """
+        prestamo = getattr(self._local, "prestamo", None)
+        if prestamo is None:
+            prestamo = self._local.prestamo = _Prestamo()
+        with self._lock:
+            conexion = prestamo.conexion
+            if conexion is not None:
+                prestamo.usos += 1
+        if conexion is None:
+            conexion = self._tomar()
+            with self._lock:
+                prestamo.conexion = conexion
+                prestamo.usos = 1
+        try:
+            yield conexion
+        finally:
+            self._soltar(prestamo)
+
+    def cerrar(self) -> None:
+        """Cierra todas las conexiones; el pool deja de prestar."""
+        with self._lock:
+            self._cerrado = True
+            while True:
+                try:
+                    self._libres.get_nowait()
+                except queue.Empty:
+                    break
+            for conexion in self._todas:
+                conexion.close()
+            self._todas.clear()
+
+    def _soltar(self, prestamo: _Prestamo) -> None:
+        with self._lock:
+            prestamo.usos -= 1
+            if prestamo.usos:
+                return
+            conexion, prestamo.conexion = prestamo.conexion, None
+            if not self._cerrado:
+                self._libres.put(conexion)
+
+    def _tomar(self) -> sqlite3.Connection:
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._cerrado:
+                raise sqlite3.ProgrammingError("El pool de conexiones está cerrado.")
+            if len(self._todas) < self._tamano:
+                conexion = self._fabrica()
+                self._todas.append(conexion)
+                return conexion
+        return self._libres.get()
+'''
+
+
 def _tpl_servicio_externo():
     return '''\
 """
@@ -1072,6 +1512,8 @@ import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ResultadoOperacion:
@@ -1085,7 +1527,7 @@ class ServicioExternoBase:
 
     def __init__(self, config: Dict[str, Any]):
         self.config  = config
-        self.logger  = logging.getLogger(__name__)
+        self.logger  = logger  # compartido por el módulo; las subclases lo usan vía self
         self.activo  = config.get("activo", False)
 
     def verificar_conexion(self) -> bool:
@@ -1105,7 +1547,7 @@ class ServicioExternoMock(ServicioExternoBase):
         return True
 
     def ejecutar(self, payload: Dict[str, Any]) -> ResultadoOperacion:
-        self.logger.info(f"ServicioExternoMock ejecutado con: {payload}")
+        self.logger.info("ServicioExternoMock ejecutado con: %s", payload)
         return ResultadoOperacion(exitoso=True, mensaje="Operación simulada correctamente.")
 '''
 
@@ -1142,7 +1584,7 @@ def configurar_logging(
         )
 
     logging.basicConfig(level=nivel_num, format=formato, handlers=handlers, force=True)
-    logging.getLogger(__name__).info(f"Logging configurado: nivel={nivel}")
+    logging.getLogger(__name__).info("Logging configurado: nivel=%s", nivel)
 '''
 
 
@@ -1203,10 +1645,13 @@ from Application.dto.entidad_dto import SolicitudCrearEntidadDTO
 class VistaPrincipal:
     """Vista principal. Consume backend a través de métodos públicos."""
 
+    TAM_PAGINA = 500  # filas por página: cada refresco lee solo lo que se muestra
+
     def __init__(self, parent, backend):
         self.parent  = parent
         self.backend = backend
         self.frame   = ttk.Frame(parent)
+        self._offset = 0
         self._crear_widgets()
         self._cargar_datos()
 
@@ -1244,21 +1689,39 @@ class VistaPrincipal:
         acciones = ttk.Frame(self.frame, padding=5)
         acciones.pack(fill=tk.X)
         ttk.Button(acciones, text="🗑️ Eliminar", command=self._eliminar).pack(side=tk.LEFT)
+        self.btn_siguiente = ttk.Button(acciones, text="▶", width=3, command=self._pagina_siguiente)
+        self.btn_siguiente.pack(side=tk.RIGHT)
+        self.btn_anterior = ttk.Button(acciones, text="◀", width=3, command=self._pagina_anterior)
+        self.btn_anterior.pack(side=tk.RIGHT)
         self.lbl_info = ttk.Label(acciones, text="")
-        self.lbl_info.pack(side=tk.RIGHT)
+        self.lbl_info.pack(side=tk.RIGHT, padx=5)
 
     def _cargar_datos(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Un solo delete con todos los ítems: una llamada a Tk en lugar de una por fila.
+        self.tree.delete(*self.tree.get_children())
         try:
-            entidades = self.backend.obtener_entidades()
-            for e in entidades:
-                self.tree.insert("", "end",
-                    values=(e.id, e.nombre, e.descripcion, e.estado), iid=str(e.id))
-            self.lbl_info.config(text=f"{len(entidades)} registros")
+            # Columnas paralelas: sin un DTO por fila, solo las tuplas que pide el Treeview.
+            cols = self.backend.columnas_entidades(limit=self.TAM_PAGINA, offset=self._offset)
+            ids  = cols["id"]
+            for fila in zip(ids, cols["nombre"], cols["descripcion"], cols["estado"]):
+                self.tree.insert("", "end", values=fila, iid=str(fila[0]))
+            if ids:
+                self.lbl_info.config(text=f"Registros {self._offset + 1}–{self._offset + len(ids)}")
+            else:
+                self.lbl_info.config(text="Sin registros")
+            self.btn_anterior.state(["!disabled" if self._offset else "disabled"])
+            self.btn_siguiente.state(["!disabled" if len(ids) == self.TAM_PAGINA else "disabled"])
         except Exception as ex:
             messagebox.showerror("Error", str(ex))
 
+    def _pagina_anterior(self):
+        self._offset = max(0, self._offset - self.TAM_PAGINA)
+        self._cargar_datos()
+
+    def _pagina_siguiente(self):
+        self._offset += self.TAM_PAGINA
+        self._cargar_datos()
+
     def _crear(self):
         nombre = self.entry_nombre.get().strip()
         if not nombre:
@@ -1296,14 +1759,14 @@ Expone métodos públicos limpios para la interfaz.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence
 
 from Application.servicios.servicio_entidad import ServicioEntidad
 from Application.dto.entidad_dto import EntidadDTO, SolicitudCrearEntidadDTO
-from Infrastructure.persistencia.base_datos.conexion import obtener_conexion
-from Infrastructure.persistencia.repositorios.repositorio_entidad_sql import RepositorioEntidadSQL
 from Infrastructure.logging.logger_config import configurar_logging
 
+logger = logging.getLogger(__name__)
+
 
 class Backend:
     """
@@ -1313,34 +1776,56 @@ class Backend:
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.logger = logging.getLogger(__name__)
         self._inicializar()
 
     def _inicializar(self):
+        # Infrastructure (sqlite3 incluido) se importa al construir, no al importar el módulo.
+        from Infrastructure.persistencia.base_datos.conexion import obtener_conexion
+        from Infrastructure.persistencia.base_datos.pool import ConnectionPool
+        from Infrastructure.persistencia.repositorios.repositorio_entidad_sql import RepositorioEntidadSQL
+
         configurar_logging(
             nivel=self.config.get("log_level", "INFO"),
             archivo=self.config.get("log_file"),
         )
-        self._conexion       = obtener_conexion(self.config.get("db_path"))
-        self._repo_entidad   = RepositorioEntidadSQL(self._conexion)
+        db_path     = self.config.get("db_path")
+        synchronous = self.config.get("sqlite_synchronous", "NORMAL")
+        # Cada conexión a :memory: es una BD distinta: en ese caso el pool tiene una sola.
+        tamano = 1 if db_path == ":memory:" else self.config.get("pool_size", 4)
+        self._pool = ConnectionPool(
+            lambda: obtener_conexion(db_path, synchronous=synchronous, check_same_thread=False),
+            tamano=tamano,
+        )
+        self._repo_entidad   = RepositorioEntidadSQL(self._pool)
         self._svc_entidad    = ServicioEntidad(self._repo_entidad)
-        self.logger.info("Backend inicializado correctamente.")
+        logger.info("Backend inicializado correctamente.")
 
     # ── API pública ──
 
-    def obtener_entidades(self, solo_activos: bool = False) -> List[EntidadDTO]:
-        return self._svc_entidad.listar(solo_activos)
+    def obtener_entidades(self, solo_activos: bool = False,
+                          limit: Optional[int] = None, offset: int = 0) -> List[EntidadDTO]:
+        return self._svc_entidad.listar(solo_activos, limit, offset)
+
+    def iterar_entidades(self, solo_activos: bool = False) -> Iterator[EntidadDTO]:
+        return self._svc_entidad.iterar(solo_activos)
+
+    def columnas_entidades(self, solo_activos: bool = False,
+                           limit: Optional[int] = None, offset: int = 0) -> Dict[str, Sequence]:
+        return self._svc_entidad.listar_columnar(solo_activos, limit, offset)
 
     def crear_entidad(self, solicitud: SolicitudCrearEntidadDTO) -> EntidadDTO:
         return self._svc_entidad.crear(solicitud)
 
+    def crear_entidades(self, solicitudes: List[SolicitudCrearEntidadDTO]) -> List[EntidadDTO]:
+        return self._svc_entidad.crear_muchos(solicitudes)
+
     def eliminar_entidad(self, entidad_id: int) -> bool:
         return self._svc_entidad.eliminar(entidad_id)
 
     def cerrar(self):
-        if hasattr(self, "_conexion"):
-            self._conexion.close()
-        self.logger.info("Backend cerrado.")
+        if hasattr(self, "_pool"):
+            self._pool.cerrar()
+        logger.info("Backend cerrado.")
 '''
 
 
@@ -1356,11 +1841,12 @@ import sys
 import os
 import argparse
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from backend import Backend
-from User_Interface.layout import crear_interfaz
 
 
 def _cargar_env():
@@ -1373,19 +1859,32 @@ def _cargar_env():
             pass  # dotenv opcional
 
 
-def _config_por_modo(modo: str) -> dict:
-    return {
-        "desarrollo": {"db_path": "data/dev.db",    "log_level": "DEBUG", "log_file": "logs/dev.log"},
-        "produccion": {"db_path": os.getenv("DB_PATH", "data/prod.db"),
-                       "log_level": "INFO",  "log_file": "logs/prod.log"},
-        "test":       {"db_path": ":memory:", "log_level": "ERROR", "log_file": None},
-    }.get(modo, {})
+# Configuración fija por modo, construida una vez al importar (solo lectura).
+_CONFIG_POR_MODO = MappingProxyType({
+    "desarrollo": MappingProxyType({"db_path": "data/dev.db", "log_level": "DEBUG",
+                                    "log_file": "logs/dev.log", "sqlite_synchronous": "NORMAL"}),
+    "produccion": MappingProxyType({"log_level": "INFO", "log_file": "logs/prod.log"}),
+    # synchronous=OFF omite todo fsync: solo aceptable en tests (ver config.py).
+    "test":       MappingProxyType({"db_path": ":memory:", "log_level": "ERROR", "log_file": None,
+                                    "sqlite_synchronous": "OFF"}),
+})
+_SIN_CONFIG = MappingProxyType({})
+
+
+def _config_por_modo(modo: str) -> Mapping:
+    config = _CONFIG_POR_MODO.get(modo, _SIN_CONFIG)
+    if modo == "produccion":
+        # DB_PATH puede venir del .env, que se carga después de importar este módulo.
+        return {**config, "db_path": os.getenv("DB_PATH", "data/prod.db")}
+    return config
 
 
 def main():
     parser = argparse.ArgumentParser(description="Proyecto — AETHERYON Dev Pattern")
     parser.add_argument("--modo", choices=["desarrollo", "produccion", "test"],
                         default="desarrollo")
+    parser.add_argument("--headless", action="store_true",
+                        help="Inicializa el backend sin cargar la interfaz (tkinter)")
     args = parser.parse_args()
 
     _cargar_env()
@@ -1394,6 +1893,11 @@ def main():
 
     try:
         print(f"🚀 Iniciando en modo: {args.modo}")
+        if args.headless:
+            print(f"✅ Backend listo: {len(backend.obtener_entidades())} entidades.")
+            return 0
+        # Importar la UI solo aquí: --headless no paga el coste de cargar tkinter.
+        from User_Interface.layout import crear_interfaz
         root = crear_interfaz(backend)
         root.mainloop()
     except KeyboardInterrupt:
@@ -1440,6 +1944,9 @@ CONFIG = {
         "log_level": "ERROR",
         "log_file":  None,
         "debug":     True,
+        # SQLite: synchronous=OFF omite todo fsync. Solo para tests (no es seguro ante caídas).
+        # Los demás perfiles usan el valor por defecto, NORMAL (con WAL).
+        "sqlite_synchronous": "OFF",
     },
 }
 '''
@@ -1451,7 +1958,7 @@ def _tpl_requirements():
 # Generado por CLI-Dev-Pattern.py — AETHERYON Dev Pattern
 
 # Core (sin dependencias externas para niveles básicos)
-# python >= 3.9
+# python >= 3.10  (dataclasses con slots=True)
 
 # Opcionales según necesidad:
 # python-dotenv>=1.0.0   # Variables de entorno
@@ -1575,6 +2082,7 @@ Regla: sin mocks, sin BD, sin red. Lógica pura.
 import pytest
 from Domain.entidades.entidad import Entidad, EstadoEntidad
 from Domain.excepciones.excepciones_dominio import NombreInvalido, EstadoInvalido
+from Domain.value_objects.nombre import Nombre
 
 
 class TestEntidad:
@@ -1617,6 +2125,23 @@ class TestEntidad:
     def test_renombrar_invalido(self):
         with pytest.raises(NombreInvalido):
             self.entidad.renombrar("")
+
+
+class TestNombre:
+
+    def test_crear_normaliza_espacios(self):
+        assert Nombre.crear("  Alfa ").valor == "Alfa"
+
+    def test_crear_valida_longitud(self):
+        with pytest.raises(NombreInvalido):
+            Nombre.crear("  x ")
+
+    def test_construccion_directa_sin_normalizar_lanza_error(self):
+        with pytest.raises(NombreInvalido):
+            Nombre("  Alfa ")
+
+    def test_construccion_directa_normalizada(self):
+        assert Nombre("Alfa") == Nombre.crear("Alfa")
 '''
 
 
@@ -1630,7 +2155,7 @@ Pruebas de la capa de Aplicación con mocks.
 import pytest
 from unittest.mock import MagicMock
 from Application.servicios.servicio_entidad import ServicioEntidad
-from Application.dto.entidad_dto import SolicitudCrearEntidadDTO
+from Application.dto.entidad_dto import EntidadDTO, SolicitudCrearEntidadDTO
 from Domain.entidades.entidad import Entidad
 from Domain.excepciones.excepciones_dominio import EntidadNoEncontrada
 
@@ -1665,12 +2190,13 @@ class TestServicioEntidad:
             servicio.obtener(99)
 
     def test_listar_entidades(self, servicio, repo_mock):
-        repo_mock.listar.return_value = [
-            Entidad(id=1, nombre="A"),
-            Entidad(id=2, nombre="B"),
+        repo_mock.listar_dtos.return_value = [
+            EntidadDTO(id=1, nombre="Alfa", descripcion="", estado="activo", esta_activo=True),
+            EntidadDTO(id=2, nombre="Beta", descripcion="", estado="activo", esta_activo=True),
         ]
         resultado = servicio.listar()
         assert len(resultado) == 2
+        repo_mock.listar_dtos.assert_called_once_with(False, None, 0)
 
     def test_eliminar_entidad(self, servicio, repo_mock):
         repo_mock.obtener_por_id.return_value = Entidad(id=1, nombre="Test")
@@ -1688,6 +2214,8 @@ Pruebas de integración para Infrastructure (BD en memoria).
 
 import pytest
 import sqlite3
+import threading
+from Infrastructure.persistencia.base_datos.pool import ConnectionPool
 from Infrastructure.persistencia.repositorios.repositorio_entidad_sql import RepositorioEntidadSQL
 from Domain.entidades.entidad import Entidad, EstadoEntidad
 
@@ -1699,6 +2227,22 @@ def repositorio(db_memoria):
 
 class TestRepositorioEntidadSQL:
 
+    def test_esquema_antiguo_pide_migrar(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE entidades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, nombre TEXT NOT NULL, descripcion TEXT,
+            estado INTEGER DEFAULT 1, fecha_creacion TEXT)""")
+        with pytest.raises(RuntimeError, match="fecha_creacion"):
+            RepositorioEntidadSQL(conn)
+
+    def test_estado_texto_pide_migrar(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE entidades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, nombre TEXT NOT NULL, descripcion TEXT,
+            estado TEXT DEFAULT "activo", fecha_creacion INTEGER)""")
+        with pytest.raises(RuntimeError, match="004_estado_int"):
+            RepositorioEntidadSQL(conn)
+
     def test_guardar_y_obtener(self, repositorio):
         entidad = Entidad(id=None, nombre="Test SQL")
         guardada = repositorio.guardar(entidad)
@@ -1706,11 +2250,34 @@ class TestRepositorioEntidadSQL:
         recuperada = repositorio.obtener_por_id(guardada.id)
         assert recuperada.nombre == "Test SQL"
 
+    def test_guardar_muchos_asigna_ids(self, repositorio):
+        previa = repositorio.guardar(Entidad(id=None, nombre="Previa"))
+        lote = repositorio.guardar_muchos([Entidad(id=None, nombre=n) for n in ("Uno", "Dos", "Tres")])
+        assert [e.id for e in lote] == [previa.id + 1, previa.id + 2, previa.id + 3]
+        assert repositorio.obtener_por_id(lote[-1].id).nombre == "Tres"
+
     def test_listar_todos(self, repositorio):
         repositorio.guardar(Entidad(id=None, nombre="A"))
         repositorio.guardar(Entidad(id=None, nombre="B"))
         assert len(repositorio.listar()) == 2
 
+    def test_iterar_recorre_varios_lotes(self, repositorio):
+        n = repositorio._TAM_LOTE + 5
+        repositorio.guardar_muchos([Entidad(id=None, nombre=f"E{i:03d}") for i in range(n)])
+        assert [e.nombre for e in repositorio.iterar()] == [f"E{i:03d}" for i in range(n)]
+
+    def test_listar_paginado(self, repositorio):
+        repositorio.guardar_muchos([Entidad(id=None, nombre=f"E{i:02d}") for i in range(10)])
+        pagina = repositorio.listar(limit=3, offset=4)
+        assert [e.nombre for e in pagina] == ["E04", "E05", "E06"]
+        assert len(repositorio.listar(offset=8)) == 2
+
+    def test_listar_columnar(self, repositorio):
+        guardadas = repositorio.guardar_muchos([Entidad(id=None, nombre=n) for n in ("Alfa", "Beta")])
+        cols = repositorio.listar_columnar()
+        assert list(cols["id"]) == [e.id for e in guardadas]
+        assert list(cols["nombre"]) == ["Alfa", "Beta"]
+
     def test_listar_solo_activos(self, repositorio):
         e1 = repositorio.guardar(Entidad(id=None, nombre="Activo"))
         e2 = repositorio.guardar(Entidad(id=None, nombre="Inactivo"))
@@ -1731,6 +2298,68 @@ class TestRepositorioEntidadSQL:
         repositorio.eliminar(e.id)
         recuperado = repositorio.obtener_por_id(e.id)
         assert recuperado.esta_activo is False
+
+    def test_iteradores_intercalados(self, repositorio):
+        repositorio.guardar_muchos([Entidad(id=None, nombre=f"E{i:02d}") for i in range(4)])
+        primero, segundo = repositorio.iterar(), repositorio.iterar()
+        assert next(primero).nombre == "E00"
+        assert next(segundo).nombre == "E00"
+        assert len(list(primero)) == 3
+        assert [e.nombre for e in segundo] == ["E01", "E02", "E03"]
+
+
+def _en_otro_hilo(funcion):
+    resultado = []
+    hilo = threading.Thread(target=lambda: resultado.append(funcion()))
+    hilo.start()
+    hilo.join()
+    return resultado[0]
+
+
+def _tomar_prestada(pool):
+    with pool.acquire() as conexion:
+        return conexion
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(lambda: sqlite3.connect(":memory:", check_same_thread=False), tamano=2)
+    yield pool
+    pool.cerrar()
+
+
+class TestConnectionPool:
+
+    def test_reutiliza_conexion_libre(self, pool):
+        assert _tomar_prestada(pool) is _tomar_prestada(pool)
+
+    def test_usos_intercalados_no_liberan_antes_de_tiempo(self, pool):
+        externo, interno = pool.acquire(), pool.acquire()
+        conexion = externo.__enter__()
+        assert interno.__enter__() is conexion
+        externo.__exit__(None, None, None)
+        assert _en_otro_hilo(lambda: _tomar_prestada(pool)) is not conexion
+        interno.__exit__(None, None, None)
+        assert _en_otro_hilo(lambda: _tomar_prestada(pool)) is conexion
+
+    def test_finalizar_en_otro_hilo_libera_el_prestamo_correcto(self, pool):
+        def iterar():
+            with pool.acquire() as conexion:
+                yield conexion
+        generador = iterar()
+        conexion = next(generador)
+        _en_otro_hilo(generador.close)
+        assert _tomar_prestada(pool) is conexion
+        with pool.acquire() as propia:
+            assert _en_otro_hilo(lambda: _tomar_prestada(pool)) is not propia
+
+    def test_cerrar_vacia_las_libres(self, pool):
+        conexion = _tomar_prestada(pool)
+        pool.cerrar()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conexion.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError, match="cerrado"):
+            _tomar_prestada(pool)
 '''
 
 
@@ -1763,6 +2392,49 @@ MIGRACIONES = [
             fecha_creacion TEXT
         );
     """),
+    ("002_indices", """
+        CREATE INDEX IF NOT EXISTS idx_entidades_estado ON entidades(estado);
+        CREATE INDEX IF NOT EXISTS idx_entidades_nombre ON entidades(nombre COLLATE NOCASE);
+    """),
+    # fecha_creacion pasa de ISO TEXT a epoch INTEGER (SQLite no permite ALTER COLUMN).
+    ("003_fecha_creacion_epoch", """
+        CREATE TABLE entidades_nueva (
+            id             INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre         TEXT    NOT NULL,
+            descripcion    TEXT    DEFAULT "",
+            estado         TEXT    DEFAULT "activo",
+            fecha_creacion INTEGER
+        );
+        INSERT INTO entidades_nueva (id, nombre, descripcion, estado, fecha_creacion)
+            SELECT id, nombre, descripcion, estado,
+                   CASE WHEN typeof(fecha_creacion) = 'text'
+                        THEN CAST(strftime('%s', fecha_creacion, 'utc') AS INTEGER)
+                        ELSE fecha_creacion END
+            FROM entidades;
+        DROP TABLE entidades;
+        ALTER TABLE entidades_nueva RENAME TO entidades;
+        CREATE INDEX IF NOT EXISTS idx_entidades_estado ON entidades(estado);
+        CREATE INDEX IF NOT EXISTS idx_entidades_nombre ON entidades(nombre COLLATE NOCASE);
+    """),
+    # estado pasa de TEXT ('activo'/'inactivo') a INTEGER (1/0).
+    ("004_estado_int", """
+        CREATE TABLE entidades_nueva (
+            id             INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre         TEXT    NOT NULL,
+            descripcion    TEXT    DEFAULT "",
+            estado         INTEGER DEFAULT 1,
+            fecha_creacion INTEGER
+        );
+        INSERT INTO entidades_nueva (id, nombre, descripcion, estado, fecha_creacion)
+            SELECT id, nombre, descripcion,
+                   CASE estado WHEN 'inactivo' THEN 0 WHEN 0 THEN 0 ELSE 1 END,
+                   fecha_creacion
+            FROM entidades;
+        DROP TABLE entidades;
+        ALTER TABLE entidades_nueva RENAME TO entidades;
+        CREATE INDEX IF NOT EXISTS idx_entidades_estado ON entidades(estado);
+        CREATE INDEX IF NOT EXISTS idx_entidades_nombre ON entidades(nombre COLLATE NOCASE);
+    """),
 ]
 
 
@@ -1849,12 +2521,14 @@ DATOS_PRUEBA = [
 
 def cargar_datos_prueba(backend: Backend):
     print("📦 Cargando datos de prueba...")
-    for dato in DATOS_PRUEBA:
-        try:
-            e = backend.crear_entidad(SolicitudCrearEntidadDTO(**dato))
-            print(f"  ✅ Creada: {e.nombre} (ID: {e.id})")
-        except Exception as ex:
-            print(f"  ⚠️  {dato['nombre']}: {ex}")
+    try:
+        # Alta masiva: una sola transacción para todo el lote.
+        creadas = backend.crear_entidades([SolicitudCrearEntidadDTO(**d) for d in DATOS_PRUEBA])
+    except Exception as ex:
+        print(f"  ⚠️  Lote no cargado: {ex}")
+        return
+    for e in creadas:
+        print(f"  ✅ Creada: {e.nombre} (ID: {e.id})")
     print("✅ Datos de prueba cargados.")
 
 
@@ -1892,6 +2566,7 @@ cp .env.example .env
 python Scripts/migraciones.py init
 python Scripts/seed_data.py
 python bootstrap.py --modo desarrollo
+python bootstrap.py --modo test --headless   # solo backend, sin tkinter
 ```
 
 ## Tests
@@ -1951,7 +2626,95 @@ Clase base para todos los ViewModels.
 Implementa el patrón Observer: las vistas se suscriben y reciben notificaciones.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import inspect
+import threading
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class Evento(namedtuple("Evento", "nombre valor_anterior valor_nuevo")):
+    """
+    Evento que reciben los suscriptores: inmutable (un suscriptor no puede alterar
+    lo que ve el siguiente) y sin diccionario por notificación.
+    Se lee como evento.nombre o, igual que en las guías, como evento["nombre"].
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, clave):
+        if isinstance(clave, str):
+            if clave not in self._fields:
+                raise KeyError(clave)
+            return getattr(self, clave)
+        return tuple.__getitem__(self, clave)
+
+
+# valor_anterior no informado: la notificación no se puede descartar por valor.
+_SIN_VALOR = object()
+
+
+def _referencia(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """
+    Referencia a un suscriptor; al llamarla devuelve el callback o None si ya murió.
+
+    Métodos ligados (vista.on_cambio) -> WeakMethod: suscribirse no mantiene viva la Vista.
+    Funciones y lambdas -> referencia fuerte: normalmente nadie más las referencia.
+    Si el objeto no admite referencias débiles (__slots__ sin __weakref__) -> fuerte.
+    """
+    if inspect.ismethod(callback):
+        try:
+            return weakref.WeakMethod(callback)
+        except TypeError:
+            pass
+    return lambda: callback
+
+
+def _recibe_evento(callback: Callable) -> bool:
+    """Si el callback acepta el Evento como argumento. Se calcula una vez, al suscribir."""
+    try:
+        parametros = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):     # sin firma inspeccionable: se asume que sí
+        return True
+    return any(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL)
+               for p in parametros)
+
+
+def _clave(callback: Callable) -> Any:
+    """
+    Clave estable del suscriptor. vista.on_cambio crea un objeto método nuevo en cada
+    acceso, así que se identifica por (instancia, función) y no por id(callback).
+    El resto (funciones, lambdas, lista.append) es su propia clave: se compara por
+    igualdad, como los métodos builtin, y ya se guarda con referencia fuerte.
+    """
+    if inspect.ismethod(callback):
+        return (id(callback.__self__), id(callback.__func__))
+    try:
+        hash(callback)
+    except TypeError:                   # invocable no hashable: solo por identidad
+        return id(callback)
+    return callback
+
+
+def propiedad_observable(nombre: str, notificar_siempre: bool = False) -> property:
+    """
+    Propiedad respaldada por el atributo "_<nombre>" que notifica "<nombre>" al asignarse.
+    Por defecto solo notifica si el valor cambia; notificar_siempre=True notifica siempre.
+    """
+    atributo = "_" + nombre
+
+    def asignar(self, valor):
+        anterior = getattr(self, atributo)
+        if notificar_siempre:
+            setattr(self, atributo, valor)
+            self.notificar_cambio(nombre)
+        elif anterior != valor:
+            setattr(self, atributo, valor)
+            self.notificar_cambio(nombre, anterior)
+
+    return property(attrgetter(atributo), asignar)
 
 
 class ViewModelBase:
@@ -1962,82 +2725,149 @@ class ViewModelBase:
     Regla: el estado de UI vive aquí, no en la Vista.
     """
 
+    # Sin __dict__ por instancia. Las subclases declaran también sus propios __slots__.
+    __slots__ = ("__weakref__", "_suscriptores", "_lock", "_propiedades", "_errores",
+                 "_tiene_errores", "_ocupado", "_mensaje", "_lote_nivel", "_lote_pendientes")
+
     def __init__(self):
-        self._suscriptores: List[Callable]    = []
+        # _clave -> (_referencia, _recibe_evento)
+        self._suscriptores: Dict[Any, Tuple[Callable, bool]] = {}
+        # Protege las altas/bajas de suscriptores y el estado de lote(); la notificación
+        # se hace sin él.
+        self._lock = threading.RLock()
         self._propiedades:  Dict[str, Any]    = {}
         self._errores:      Dict[str, str]    = {}
+        self._tiene_errores: bool             = False  # bool(_errores), mantenido al mutar
         self._ocupado:      bool              = False
         self._mensaje:      str               = ""
+        # Notificaciones agrupadas (ver lote()): nombre -> primer valor_anterior.
+        self._lote_nivel:      int            = 0
+        self._lote_pendientes: Dict[str, Any] = {}
 
     # ── Sistema observable ──
 
     def suscribir(self, callback: Callable) -> None:
-        """La Vista llama a este método para recibir cambios."""
-        if callback not in self._suscriptores:
-            self._suscriptores.append(callback)
+        """
+        La Vista llama a este método para recibir cambios. Alta y baja en O(1).
+        El callback puede aceptar el Evento o no recibir argumentos.
+        """
+        clave = _clave(callback)
+        with self._lock:
+            entrada = self._suscriptores.get(clave)
+            if entrada is None or entrada[0]() is None:  # nuevo, o reemplaza uno muerto
+                self._suscriptores[clave] = (_referencia(callback), _recibe_evento(callback))
 
     def desuscribir(self, callback: Callable) -> None:
-        self._suscriptores = [s for s in self._suscriptores if s != callback]
-
-    def notificar_cambio(self, nombre: str, valor_anterior: Any = None) -> None:
-        evento = {
-            "nombre":          nombre,
-            "valor_anterior":  valor_anterior,
-            "valor_nuevo":     self._propiedades.get(nombre),
-        }
-        for callback in self._suscriptores:
+        with self._lock:
+            self._suscriptores.pop(_clave(callback), None)
+
+    @contextmanager
+    def lote(self) -> Iterator[None]:
+        """
+        Agrupa las notificaciones del bloque: cada propiedad cambiada se notifica
+        una sola vez al salir (con su valor final). Si termina con el mismo valor
+        con el que empezó (ocupado True -> False) no se notifica. Admite anidamiento.
+        """
+        with self._lock:
+            self._lote_nivel += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._lote_nivel -= 1
+                pendientes = {}
+                if not self._lote_nivel:
+                    pendientes, self._lote_pendientes = self._lote_pendientes, {}
+            for nombre, anterior in pendientes.items():
+                if anterior is not _SIN_VALOR and self._valor_actual(nombre) == anterior:
+                    continue
+                self._emitir(nombre, anterior)
+
+    def notificar_cambio(self, nombre: str, valor_anterior: Any = _SIN_VALOR) -> None:
+        if not self._suscriptores:      # sin vistas suscritas no hay evento que construir
+            return
+        if self._lote_nivel:
+            with self._lock:
+                if self._lote_nivel:
+                    self._lote_pendientes.setdefault(nombre, valor_anterior)
+                    return
+        self._emitir(nombre, valor_anterior)
+
+    def _valor_actual(self, nombre: str) -> Any:
+        """Valor de "nombre": de establecer_propiedad o de la propiedad homónima."""
+        if nombre in self._propiedades:
+            return self._propiedades[nombre]
+        if isinstance(getattr(type(self), nombre, None), property):
+            return getattr(self, nombre)
+        return None
+
+    def _emitir(self, nombre: str, valor_anterior: Any) -> None:
+        if valor_anterior is _SIN_VALOR:
+            valor_anterior = None
+        evento = Evento(nombre, valor_anterior, self._valor_actual(nombre))
+        # Copia bajo el lock y se notifica fuera: un callback puede (des)suscribirse
+        # sin bloquearse ni alterar el diccionario que se está recorriendo.
+        with self._lock:
+            suscriptores = tuple(self._suscriptores.items())
+        for clave, entrada in suscriptores:
+            ref, recibe_evento = entrada
+            callback = ref()
+            if callback is None:        # la Vista ya fue recolectada
+                with self._lock:
+                    if self._suscriptores.get(clave) is entrada:
+                        del self._suscriptores[clave]
+                continue
             try:
-                callback(evento)
+                if recibe_evento:
+                    callback(evento)
+                else:
+                    callback()
             except Exception as ex:
                 print(f"[ViewModelBase] Error en suscriptor: {ex}")
 
     def establecer_propiedad(self, nombre: str, valor: Any) -> bool:
         """Establece propiedad y notifica solo si cambió."""
-        anterior = self._propiedades.get(nombre)
-        if anterior != valor:
-            self._propiedades[nombre] = valor
+        propiedades = self._propiedades
+        anterior = propiedades.get(nombre)
+        if anterior == valor:
+            return False
+        propiedades[nombre] = valor
+        if self._suscriptores:
             self.notificar_cambio(nombre, anterior)
-            return True
-        return False
+        return True
 
     # ── Estado estándar ──
 
-    @property
-    def ocupado(self) -> bool:
-        return self._ocupado
-
-    @ocupado.setter
-    def ocupado(self, valor: bool):
-        if self._ocupado != valor:
-            self._ocupado = valor
-            self.notificar_cambio("ocupado")
-
-    @property
-    def mensaje(self) -> str:
-        return self._mensaje
-
-    @mensaje.setter
-    def mensaje(self, texto: str):
-        self._mensaje = texto
-        self.notificar_cambio("mensaje")
+    ocupado = propiedad_observable("ocupado")
+    mensaje = propiedad_observable("mensaje")   # reasignar el mismo texto no notifica
 
     # ── Errores de validación UI ──
 
     def agregar_error(self, campo: str, mensaje: str) -> None:
         self._errores[campo] = mensaje
         self.notificar_cambio(f"error_{campo}")
+        self._actualizar_tiene_errores()
 
     def limpiar_error(self, campo: str) -> None:
         if campo in self._errores:
             del self._errores[campo]
             self.notificar_cambio(f"error_{campo}")
+            self._actualizar_tiene_errores()
 
     def limpiar_errores(self) -> None:
         self._errores.clear()
         self.notificar_cambio("errores")
+        self._actualizar_tiene_errores()
+
+    def _actualizar_tiene_errores(self) -> None:
+        # "tiene_errores" se notifica solo cuando cambia (p. ej. para habilitar "Guardar").
+        tiene = bool(self._errores)
+        if tiene != self._tiene_errores:
+            self._tiene_errores = tiene
+            self.notificar_cambio("tiene_errores")
 
     def tiene_errores(self) -> bool:
-        return bool(self._errores)
+        return self._tiene_errores
 
     def obtener_error(self, campo: str) -> Optional[str]:
         return self._errores.get(campo)
@@ -2054,29 +2884,54 @@ Regla #16: transforma DTOs en modelos de UI, coordina llamadas al backend.
 """
 
 from typing import List, Optional
-from Presentation.viewmodels.viewmodel_base import ViewModelBase
+from Application.dto.entidad_dto import SolicitudCrearEntidadDTO
+from Presentation.viewmodels.viewmodel_base import ViewModelBase, propiedad_observable
 from Presentation.models.ui_entidad import UIEntidad
 
 
 class EntidadViewModel(ViewModelBase):
 
+    __slots__ = ("backend", "_entidades", "_entidad_seleccionada", "_filtro", "_filtro_lower",
+                 "_modo_edicion", "_entidades_filtradas", "_filtrado_con", "_filtrado_generacion")
+
     def __init__(self, backend):
         super().__init__()
         self.backend = backend
         self._entidades:           List[UIEntidad]     = []
         self._entidad_seleccionada: Optional[UIEntidad] = None
         self._filtro:               str                = ""
+        self._filtro_lower:         str                = ""   # _filtro.lower(), calculado al asignar
         self._modo_edicion:         bool               = False
+        # Resultado de filtrar _entidades con _filtrado_con. None = hay que recalcularlo.
+        self._entidades_filtradas:  Optional[List[UIEntidad]] = None
+        self._filtrado_con:         str                = ""
+        self._filtrado_generacion:  int                = UIEntidad.generacion_nombres
         self.cargar()
 
     # ── Propiedades observables ──
 
     @property
     def entidades(self) -> List[UIEntidad]:
-        if not self._filtro:
+        f = self._filtro_lower
+        if not f:
             return self._entidades
-        f = self._filtro.lower()
-        return [e for e in self._entidades if f in e.nombre.lower()]
+        # La vista lee la lista varias veces por refresco: se filtra una sola vez.
+        previo = self._entidades_filtradas
+        generacion = UIEntidad.generacion_nombres   # cambia si se renombró una entidad
+        renombradas = generacion != self._filtrado_generacion
+        if previo is None or renombradas or self._filtrado_con != f:
+            # Escribiendo letra a letra el filtro nuevo contiene al anterior: sus
+            # coincidencias son un subconjunto de las previas y basta con recorrerlas.
+            if (previo is None or renombradas
+                    or not self._filtrado_con or self._filtrado_con not in f):
+                previo = self._entidades
+            self._entidades_filtradas = [e for e in previo if f in e.nombre_lower]
+            self._filtrado_con = f
+            self._filtrado_generacion = generacion
+        return self._entidades_filtradas
+
+    def _invalidar_filtro(self):
+        self._entidades_filtradas = None
 
     @property
     def filtro(self) -> str:
@@ -2085,98 +2940,99 @@ class EntidadViewModel(ViewModelBase):
     @filtro.setter
     def filtro(self, valor: str):
         self._filtro = valor
+        filtro_lower = valor.lower()
+        if filtro_lower == self._filtro_lower:
+            return  # mismo filtro efectivo (p. ej. solo cambia mayúsculas): mismo resultado
+        self._filtro_lower = filtro_lower   # el getter recalcula (de forma incremental)
         self.notificar_cambio("entidades")
 
-    @property
-    def entidad_seleccionada(self) -> Optional[UIEntidad]:
-        return self._entidad_seleccionada
-
-    @entidad_seleccionada.setter
-    def entidad_seleccionada(self, e: Optional[UIEntidad]):
-        self._entidad_seleccionada = e
-        self.notificar_cambio("entidad_seleccionada")
-
-    @property
-    def modo_edicion(self) -> bool:
-        return self._modo_edicion
-
-    @modo_edicion.setter
-    def modo_edicion(self, valor: bool):
-        self._modo_edicion = valor
-        self.notificar_cambio("modo_edicion")
+    entidad_seleccionada = propiedad_observable("entidad_seleccionada", notificar_siempre=True)
+    modo_edicion         = propiedad_observable("modo_edicion", notificar_siempre=True)
 
     # ── Casos de uso de UI ──
 
     def cargar(self):
-        self.ocupado = True
-        self.mensaje = "Cargando..."
-        try:
-            dtos = self.backend.obtener_entidades()
-            self._entidades = [UIEntidad.from_dto(d) for d in dtos]
-            self.mensaje = f"{len(self._entidades)} registros cargados."
-            self.notificar_cambio("entidades")
-        except Exception as ex:
-            self.mensaje = f"Error al cargar: {ex}"
-        finally:
-            self.ocupado = False
+        with self.lote():
+            self.ocupado = True
+            self.mensaje = "Cargando..."
+            try:
+                dtos = self.backend.obtener_entidades()
+                self._entidades = list(map(UIEntidad.from_dto, dtos))
+                self._invalidar_filtro()
+                self.mensaje = f"{len(self._entidades)} registros cargados."
+                self.notificar_cambio("entidades")
+            except Exception as ex:
+                self.mensaje = f"Error al cargar: {ex}"
+            finally:
+                self.ocupado = False
 
     def nueva(self):
         self._entidad_seleccionada = UIEntidad()
         self.modo_edicion = True
 
     def guardar(self) -> bool:
-        if not self._entidad_seleccionada:
-            return False
-
-        errores = self._entidad_seleccionada.validar()
-        if errores:
-            for campo, msg in errores.items():
-                self.agregar_error(campo, msg)
-            return False
-
-        self.limpiar_errores()
-        self.ocupado = True
-        self.mensaje = "Guardando..."
-        try:
-            from Application.dto.entidad_dto import SolicitudCrearEntidadDTO
-            if self._entidad_seleccionada.id:
-                # TODO: implementar actualizar en backend
-                pass
-            else:
-                dto = self.backend.crear_entidad(
-                    SolicitudCrearEntidadDTO(
-                        nombre=self._entidad_seleccionada.nombre,
-                        descripcion=self._entidad_seleccionada.descripcion,
+        with self.lote():
+            if not self._entidad_seleccionada:
+                return False
+
+            errores = self._entidad_seleccionada.validar()
+            if errores:
+                for campo, msg in errores.items():
+                    self.agregar_error(campo, msg)
+                return False
+
+            self.limpiar_errores()
+            self.ocupado = True
+            self.mensaje = "Guardando..."
+            try:
+                if self._entidad_seleccionada.id:
+                    # TODO: implementar actualizar en backend
+                    pass
+                else:
+                    dto = self.backend.crear_entidad(
+                        SolicitudCrearEntidadDTO(
+                            nombre=self._entidad_seleccionada.nombre,
+                            descripcion=self._entidad_seleccionada.descripcion,
+                        )
                     )
-                )
-                self._entidad_seleccionada.id = dto.id
-
-            self.mensaje = "Guardado correctamente."
-            self.modo_edicion = False
-            self.cargar()
-            return True
-        except Exception as ex:
-            self.mensaje = f"Error al guardar: {ex}"
-            return False
-        finally:
-            self.ocupado = False
+                    self._entidad_seleccionada.id = dto.id
+                    # Se añade solo la nueva entidad; no hace falta recargar la colección.
+                    self._entidades.append(UIEntidad.from_dto(dto))
+                    self._invalidar_filtro()
+                    self.notificar_cambio("entidades")
+
+                self.mensaje = "Guardado correctamente."
+                self.modo_edicion = False
+                return True
+            except Exception as ex:
+                self.mensaje = f"Error al guardar: {ex}"
+                return False
+            finally:
+                self.ocupado = False
 
     def eliminar_seleccionada(self) -> bool:
-        if not self._entidad_seleccionada or not self._entidad_seleccionada.id:
-            return False
-        self.ocupado = True
-        try:
-            self.backend.eliminar_entidad(self._entidad_seleccionada.id)
-            self._entidad_seleccionada = None
-            self.notificar_cambio("entidad_seleccionada")
-            self.mensaje = "Eliminado correctamente."
-            self.cargar()
-            return True
-        except Exception as ex:
-            self.mensaje = f"Error al eliminar: {ex}"
-            return False
-        finally:
-            self.ocupado = False
+        with self.lote():
+            if not self._entidad_seleccionada or not self._entidad_seleccionada.id:
+                return False
+            self.ocupado = True
+            try:
+                entidad_id = self._entidad_seleccionada.id
+                self.backend.eliminar_entidad(entidad_id)
+                # Borrado lógico: la entidad sigue en la lista como inactiva (igual que al recargar).
+                for e in self._entidades:
+                    if e.id == entidad_id:
+                        e.estado = "inactivo"
+                        break
+                self._entidad_seleccionada = None
+                self.notificar_cambio("entidad_seleccionada")
+                self.notificar_cambio("entidades")
+                self.mensaje = "Eliminado correctamente."
+                return True
+            except Exception as ex:
+                self.mensaje = f"Error al eliminar: {ex}"
+                return False
+            finally:
+                self.ocupado = False
 '''
 
 
@@ -2191,28 +3047,40 @@ Puede contener validaciones de formato.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import ClassVar, Optional, Dict
 from Application.dto.entidad_dto import EntidadDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class UIEntidad:
     """Modelo de UI. Solo datos y estado de presentación."""
+    # Crece al renombrar cualquier UIEntidad: invalida los filtros por nombre cacheados.
+    generacion_nombres: ClassVar[int] = 0
+
     id:           Optional[int] = None
     nombre:       str           = ""
     descripcion:  str           = ""
     estado:       str           = "activo"
     seleccionado: bool          = False
     editando:     bool          = False
+    # nombre en minúsculas para el filtro de la vista; se mantiene en __setattr__.
+    nombre_lower: str           = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, atributo, valor):
+        object.__setattr__(self, atributo, valor)
+        if atributo == "nombre":
+            object.__setattr__(self, "nombre_lower", valor.lower())
+            UIEntidad.generacion_nombres += 1
 
     def validar(self) -> Dict[str, str]:
         """Validaciones de formato (no reglas de negocio)."""
-        errores = {}
-        if not self.nombre or len(self.nombre.strip()) < 2:
-            errores["nombre"] = "Mínimo 2 caracteres."
-        if len(self.nombre) > 100:
-            errores["nombre"] = "Máximo 100 caracteres."
-        return errores
+        # Se ejecuta en cada pulsación: una lectura del atributo y salida temprana.
+        nombre = self.nombre
+        if len(nombre) > 100:
+            return {"nombre": "Máximo 100 caracteres."}
+        if len(nombre.strip()) < 2:
+            return {"nombre": "Mínimo 2 caracteres."}
+        return {}
 
     def to_dict(self) -> dict:
         return {
@@ -2224,12 +3092,18 @@ class UIEntidad:
 
     @classmethod
     def from_dto(cls, dto: EntidadDTO) -> "UIEntidad":
-        return cls(
-            id=dto.id,
-            nombre=dto.nombre,
-            descripcion=dto.descripcion,
-            estado=dto.estado,
-        )
+        # Se llama por cada fila en cargar(): rellena los slots directamente, sin pasar
+        # por __init__ ni por el __setattr__ de arriba en cada campo.
+        e = cls.__new__(cls)
+        asignar = object.__setattr__
+        asignar(e, "id", dto.id)
+        asignar(e, "nombre", dto.nombre)
+        asignar(e, "descripcion", dto.descripcion)
+        asignar(e, "estado", dto.estado)
+        asignar(e, "seleccionado", False)
+        asignar(e, "editando", False)
+        asignar(e, "nombre_lower", dto.nombre.lower())
+        return e
 '''
 
 
@@ -2246,6 +3120,9 @@ Las reglas de negocio viven en Domain.
 import re
 from typing import Optional
 
+# Compilado una vez al importar: validar_email se invoca en cada pulsación del formulario.
+_EMAIL_RE = re.compile(r"^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$")
+
 
 def validar_no_vacio(valor: str, campo: str = "Campo") -> Optional[str]:
     if not valor or not valor.strip():
@@ -2263,8 +3140,7 @@ def validar_longitud(valor: str, minimo: int = 2, maximo: int = 100,
 
 
 def validar_email(valor: str) -> Optional[str]:
-    patron = r"^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$"
-    if not re.match(patron, valor):
+    if not _EMAIL_RE.match(valor):
         return "Formato de email inválido."
     return None
 
@@ -2311,6 +3187,7 @@ class ComandoBase(ABC):
 
     def puede_ejecutar(self) -> bool:
         """Verifica precondiciones antes de ejecutar."""
+        # Se lee en vivo: dentro de lote() el cambio de "ocupado" no se notifica a tiempo.
         return not self.viewmodel.ocupado
 
     def deshacer(self) -> None:
@@ -2400,9 +3277,13 @@ Pruebas del ViewModel sin interfaz gráfica.
 Ventaja MVVM: los ViewModels son completamente testeables sin UI.
 """
 
+import gc
+import weakref
+
 import pytest
 from unittest.mock import MagicMock
 from Presentation.viewmodels.entidad_viewmodel import EntidadViewModel
+from Presentation.commands.comandos_entidad import ComandoCargar, ComandoNueva
 from Application.dto.entidad_dto import EntidadDTO
 
 
@@ -2431,6 +3312,45 @@ class TestEntidadViewModel:
         assert len(viewmodel.entidades) == 1
         assert viewmodel.entidades[0].nombre == "A"
 
+    def test_filtro_se_recalcula_tras_cargar(self, viewmodel, backend_mock):
+        viewmodel.filtro = "A"
+        assert viewmodel.entidades is viewmodel.entidades  # cacheado entre lecturas
+        backend_mock.obtener_entidades.return_value = []
+        viewmodel.cargar()
+        assert viewmodel.entidades == []
+
+    def test_filtro_incremental(self, viewmodel, backend_mock):
+        backend_mock.obtener_entidades.return_value = [
+            EntidadDTO(id=i, nombre=n, descripcion="", estado="activo", esta_activo=True)
+            for i, n in enumerate(("Alfa", "Alba", "Beta"), start=1)
+        ]
+        viewmodel.cargar()
+        viewmodel.filtro = "al"
+        assert [e.nombre for e in viewmodel.entidades] == ["Alfa", "Alba"]
+        viewmodel.filtro = "alf"
+        assert [e.nombre for e in viewmodel.entidades] == ["Alfa"]
+        viewmodel.filtro = "a"  # borrar letras vuelve a recorrer toda la lista
+        assert [e.nombre for e in viewmodel.entidades] == ["Alfa", "Alba", "Beta"]
+
+    def test_filtro_sigue_a_los_renombrados(self, viewmodel, backend_mock):
+        backend_mock.obtener_entidades.return_value = [
+            EntidadDTO(id=i, nombre=n, descripcion="", estado="activo", esta_activo=True)
+            for i, n in enumerate(("Alfa", "Alba", "Beta"), start=1)
+        ]
+        viewmodel.cargar()
+        alfa, _, beta = viewmodel.entidades
+        viewmodel.filtro = "al"
+        assert [e.nombre for e in viewmodel.entidades] == ["Alfa", "Alba"]
+        alfa.nombre = "Zeta"
+        assert [e.nombre for e in viewmodel.entidades] == ["Alba"]
+        beta.nombre = "Alba"
+        assert [e.nombre for e in viewmodel.entidades] == ["Alba", "Alba"]
+
+    def test_nombre_lower_sigue_al_nombre(self, viewmodel):
+        entidad = viewmodel.entidades[0]
+        entidad.nombre = "Zeta"
+        assert entidad.nombre_lower == "zeta"
+
     def test_filtro_vacio_muestra_todos(self, viewmodel):
         viewmodel.filtro = "A"
         viewmodel.filtro = ""
@@ -2448,12 +3368,165 @@ class TestEntidadViewModel:
         viewmodel.filtro = "test"
         assert "entidades" in cambios
 
+    def test_cargar_notifica_cada_propiedad_una_vez(self, viewmodel, backend_mock):
+        cambios = []
+        viewmodel.suscribir(lambda e: cambios.append(e.nombre))
+        backend_mock.obtener_entidades.return_value = []
+        viewmodel.cargar()
+        assert sorted(cambios) == ["entidades", "mensaje"]  # ocupado acaba como empezó
+
+    def test_lote_informa_valores_y_omite_lo_que_no_cambia(self, viewmodel):
+        eventos = []
+        viewmodel.suscribir(eventos.append)
+        viewmodel.mensaje = "Inicio"
+        eventos.clear()
+        with viewmodel.lote():
+            viewmodel.ocupado = True
+            viewmodel.mensaje = "Trabajando..."
+            viewmodel.mensaje = "Listo."
+            viewmodel.ocupado = False
+        assert [(e.nombre, e.valor_anterior, e.valor_nuevo) for e in eventos] == [
+            ("mensaje", "Inicio", "Listo.")]
+
+    def test_evento_admite_acceso_por_clave(self, viewmodel):
+        eventos = []
+        viewmodel.suscribir(eventos.append)
+        viewmodel.mensaje = "Hola"
+        evento = eventos[0]
+        assert evento["nombre"] == evento.nombre == evento[0] == "mensaje"
+        assert evento["valor_nuevo"] == "Hola"
+        with pytest.raises(KeyError):
+            evento["otro"]
+
+    def test_suscribir_metodo_builtin_dos_veces(self, viewmodel):
+        eventos = []
+        viewmodel.suscribir(eventos.append)
+        viewmodel.suscribir(eventos.append)
+        viewmodel.filtro = "x"
+        assert len(eventos) == 1
+        viewmodel.desuscribir(eventos.append)
+        viewmodel.filtro = ""
+        assert len(eventos) == 1
+
+    def test_suscriptor_sin_argumentos(self, viewmodel):
+        llamadas = []
+        viewmodel.suscribir(lambda: llamadas.append(1))
+        viewmodel.filtro = "x"
+        assert llamadas == [1]
+
+    def test_mensaje_repetido_no_notifica(self, viewmodel):
+        cambios = []
+        viewmodel.suscribir(lambda e: cambios.append(e.nombre))
+        viewmodel.mensaje = "Hola"
+        viewmodel.mensaje = "Hola"
+        assert cambios == ["mensaje"]
+
+    def test_suscriptor_puede_desuscribirse_al_notificar(self, viewmodel):
+        cambios = []
+
+        def una_vez(evento):
+            cambios.append(evento.nombre)
+            viewmodel.desuscribir(una_vez)
+
+        viewmodel.suscribir(una_vez)
+        viewmodel.filtro = "x"
+        viewmodel.filtro = ""
+        assert cambios == ["entidades"]
+
+    def test_suscripcion_no_mantiene_viva_la_vista(self, viewmodel):
+        class Vista:
+            def __init__(self):
+                self.cambios = []
+
+            def on_cambio(self, evento):
+                self.cambios.append(evento.nombre)
+
+        vista = Vista()
+        viewmodel.suscribir(vista.on_cambio)
+        viewmodel.filtro = "x"
+        assert vista.cambios == ["entidades"]
+
+        ref = weakref.ref(vista)
+        del vista
+        gc.collect()
+        assert ref() is None
+        viewmodel.filtro = ""  # el suscriptor muerto se descarta sin error
+
+    def test_suscribir_vista_sin_weakref(self, viewmodel):
+        class Vista:
+            __slots__ = ("cambios",)
+
+            def __init__(self):
+                self.cambios = []
+
+            def on_cambio(self, evento):
+                self.cambios.append(evento.nombre)
+
+        vista = Vista()
+        viewmodel.suscribir(vista.on_cambio)
+        viewmodel.filtro = "x"
+        assert vista.cambios == ["entidades"]
+
+    def test_guardar_agrega_sin_recargar(self, viewmodel, backend_mock):
+        backend_mock.crear_entidad.return_value = EntidadDTO(
+            id=3, nombre="Gamma", descripcion="", estado="activo", esta_activo=True)
+        viewmodel.nueva()
+        viewmodel.entidad_seleccionada.nombre = "Gamma"
+        assert viewmodel.guardar() is True
+        assert [e.id for e in viewmodel.entidades] == [1, 2, 3]
+        assert backend_mock.obtener_entidades.call_count == 1  # solo la carga inicial
+
+    def test_eliminar_marca_inactiva_sin_recargar(self, viewmodel, backend_mock):
+        viewmodel.entidad_seleccionada = viewmodel.entidades[0]
+        assert viewmodel.eliminar_seleccionada() is True
+        backend_mock.eliminar_entidad.assert_called_once_with(1)
+        assert viewmodel.entidades[0].estado == "inactivo"
+        assert backend_mock.obtener_entidades.call_count == 1
+
     def test_guardar_con_nombre_invalido(self, viewmodel):
         viewmodel.nueva()
         viewmodel.entidad_seleccionada.nombre = "x"  # inválido
         resultado = viewmodel.guardar()
         assert resultado is False
         assert viewmodel.tiene_errores()
+
+    def test_tiene_errores_notifica_solo_al_cambiar(self, viewmodel):
+        cambios = []
+        viewmodel.suscribir(lambda e: cambios.append(e.nombre))
+        viewmodel.agregar_error("nombre", "Mínimo 2 caracteres.")
+        viewmodel.agregar_error("descripcion", "Demasiado larga.")
+        viewmodel.limpiar_errores()
+        assert cambios.count("tiene_errores") == 2
+        assert not viewmodel.tiene_errores()
+
+    def test_comando_no_se_ejecuta_mientras_esta_ocupado(self, viewmodel):
+        comando = ComandoNueva(viewmodel)
+        viewmodel.ocupado = True
+        assert comando.puede_ejecutar() is False
+        comando.ejecutar()
+        assert comando.ejecutado is False and viewmodel.entidad_seleccionada is None
+        viewmodel.ocupado = False
+        comando.ejecutar()
+        assert comando.ejecutado is True
+
+    def test_comando_ve_ocupado_durante_un_lote(self, viewmodel, backend_mock):
+        comando = ComandoCargar(viewmodel)
+        habilitado = []
+
+        def obtener_entidades():
+            habilitado.append(comando.puede_ejecutar())
+            return []
+
+        backend_mock.obtener_entidades.side_effect = obtener_entidades
+        comando.ejecutar()
+        assert habilitado == [False]
+        assert comando.puede_ejecutar() is True
+
+    def test_comando_con_viewmodel_simulado(self):
+        viewmodel = MagicMock(ocupado=False)
+        comando = ComandoCargar(viewmodel)
+        comando.ejecutar()
+        viewmodel.cargar.assert_called_once_with()
 '''
 
 
@@ -2511,27 +3584,54 @@ refactor(backend): simplificar inyección de servicios
 '''
 
 
+# ── Templates precalculados al importar (los contenidos son inmutables) ──
+
+_SIN_TEMPLATES = MappingProxyType({})
+
+_TEMPLATES_POR_NIVEL = {
+    nivel: MappingProxyType(_construir_templates(nivel)) for nivel in NIVELES
+}
+
+_TEMPLATES_BYTES_POR_NIVEL = {
+    nivel: MappingProxyType({ruta: contenido.encode("utf-8") for ruta, contenido in templates.items()})
+    for nivel, templates in _TEMPLATES_POR_NIVEL.items()
+}
+
+_MANIFIESTOS_POR_NIVEL = {
+    nivel: TemplateManifest(nivel, tuple(templates)) for nivel, templates in _TEMPLATES_POR_NIVEL.items()
+}
+
+_DIRECTORIOS_POR_NIVEL = {
+    nivel: tuple(sorted(
+        {Path(ruta).parent.as_posix() for ruta in templates} - {"."},
+        key=lambda d: (d.count("/"), d),
+    ))
+    for nivel, templates in _TEMPLATES_POR_NIVEL.items()
+}
+
+
 # ─────────────────────────────────────────────
 #  GENERADOR DE ESTRUCTURA
 # ─────────────────────────────────────────────
 
 def generar_estructura(nivel: int, ruta: Path) -> None:
     """Crea todos los archivos y directorios del nivel indicado."""
-    templates = get_templates(nivel)
-    creados   = 0
-    omitidos  = 0
+    manifiesto = get_manifest(nivel)
+    creados    = 0
+    omitidos   = 0
 
-    for ruta_relativa, contenido in templates.items():
-        archivo = ruta / ruta_relativa
+    # Crear cada directorio una sola vez (padres antes que hijos)
+    for directorio in get_parent_dirs(nivel):
+        (ruta / directorio).mkdir(parents=True, exist_ok=True)
 
-        # Crear directorios intermedios
-        archivo.parent.mkdir(parents=True, exist_ok=True)
+    for ruta_relativa in manifiesto.paths:
+        archivo = ruta / ruta_relativa
 
         if archivo.exists():
             omitidos += 1
             print(f"  {c('~', 'yellow')} {ruta_relativa} (ya existe, omitido)")
         else:
-            archivo.write_text(contenido, encoding="utf-8")
+            archivo.write_bytes(manifiesto.get_bytes(ruta_relativa))
             creados += 1
             print(f"  {c('✓', 'green')} {ruta_relativa}")
 